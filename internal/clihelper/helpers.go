@@ -1,19 +1,36 @@
 package clihelper
 
 import (
+	"bufio"
 	"errors"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
 	"path/filepath"
+	"slices"
+	"strconv"
+	"strings"
+	"sync"
 
 	"github.com/charmbracelet/huh"
 	"github.com/dagimg-dot/floww/internal/config"
+	"github.com/mattn/go-isatty"
+	"github.com/spf13/cobra"
 )
 
+// errorPrefix is the "Error:" label for PrintError, styled only when stderr
+// is a terminal and NO_COLOR is unset.  It is decided once per process.
+var errorPrefix = sync.OnceValue(func() string {
+	if isatty.IsTerminal(os.Stderr.Fd()) && os.Getenv("NO_COLOR") == "" {
+		return "\033[1;31mError:\033[0m "
+	}
+	return "Error: "
+})
+
 // PrintError writes a styled error message to stderr.
 func PrintError(msg string) {
-	fmt.Fprintf(os.Stderr, "\033[1;31mError:\033[0m %s\n", msg)
+	_, _ = os.Stderr.WriteString(errorPrefix() + msg + "\n")
 }
 
 // CheckInitialized returns an error when floww has not been initialised yet.
@@ -25,6 +42,20 @@ func CheckInitialized(cfg *config.ConfigManager) error {
 	return nil
 }
 
+// simplePromptEnv opts into plain line-based prompts on stdin instead of the
+// interactive huh forms, which take over the terminal to render.
+const simplePromptEnv = "FLOWW_SIMPLE_PROMPT"
+
+// stdin is shared by the plain prompts: a bufio.Reader may read past the
+// answer it returns, so a second reader over os.Stdin would miss input that
+// the first one already buffered (e.g. answers piped in for select, then
+// confirm).
+var stdin = bufio.NewReader(os.Stdin)
+
+func useSimplePrompt() bool {
+	return os.Getenv(simplePromptEnv) != ""
+}
+
 // SelectWorkflow presents an interactive huh select list of available workflow
 // names.  It returns the selected name, or exits when cancelled / empty.
 func SelectWorkflow(cfg *config.ConfigManager, action string) string {
@@ -34,12 +65,18 @@ func SelectWorkflow(cfg *config.ConfigManager, action string) string {
 		os.Exit(1)
 	}
 
+	title := fmt.Sprintf("Select a workflow to %s:", action)
 	var selected string
-	err := huh.NewSelect[string]().
-		Title(fmt.Sprintf("Select a workflow to %s:", action)).
-		Options(huh.NewOptions(available...)...).
-		Value(&selected).
-		Run()
+	var err error
+	if useSimplePrompt() {
+		selected, err = simpleSelect(stdin, os.Stdout, title, available)
+	} else {
+		err = huh.NewSelect[string]().
+			Title(title).
+			Options(huh.NewOptions(available...)...).
+			Value(&selected).
+			Run()
+	}
 
 	if errors.Is(err, huh.ErrUserAborted) {
 		fmt.Println("No workflow selected")
@@ -53,6 +90,83 @@ func SelectWorkflow(cfg *config.ConfigManager, action string) string {
 	return selected
 }
 
+// Confirm asks a yes/no question, defaulting to no.
+func Confirm(title string) (bool, error) {
+	if useSimplePrompt() {
+		return simpleConfirm(stdin, os.Stdout, title)
+	}
+	confirmed := false
+	err := huh.NewConfirm().
+		Title(title).
+		Value(&confirmed).
+		Run()
+	return confirmed, err
+}
+
+// simpleSelect prints options as a numbered list and reads the chosen number
+// from in.  An empty answer or end of input aborts with huh.ErrUserAborted.
+func simpleSelect(in *bufio.Reader, out io.Writer, title string, options []string) (string, error) {
+	var b strings.Builder
+	b.WriteString(title)
+	b.WriteByte('\n')
+	for i, opt := range options {
+		fmt.Fprintf(&b, "  %d) %s\n", i+1, opt)
+	}
+	b.WriteString("> ")
+	_, _ = io.WriteString(out, b.String())
+
+	line, err := in.ReadString('\n')
+	line = strings.TrimSpace(line)
+	if line == "" {
+		if err != nil && !errors.Is(err, io.EOF) {
+			return "", err
+		}
+		return "", huh.ErrUserAborted
+	}
+	n, convErr := strconv.Atoi(line)
+	if convErr != nil || n < 1 || n > len(options) {
+		return "", fmt.Errorf("invalid choice %q", line)
+	}
+	return options[n-1], nil
+}
+
+// simpleConfirm reads a y/N answer from in.
+func simpleConfirm(in *bufio.Reader, out io.Writer, title string) (bool, error) {
+	_, _ = fmt.Fprintf(out, "%s [y/N] ", title)
+	line, err := in.ReadString('\n')
+	if err != nil && !errors.Is(err, io.EOF) {
+		return false, err
+	}
+	switch strings.ToLower(strings.TrimSpace(line)) {
+	case "y", "yes":
+		return true, nil
+	}
+	return false, nil
+}
+
+// CompleteWorkflowName is a cobra ValidArgsFunction that offers workflow
+// names for a command's single positional argument.  The workflows directory
+// is only read when the shell actually asks for completions.
+func CompleteWorkflowName(_ *cobra.Command, args []string, _ string) ([]string, cobra.ShellCompDirective) {
+	if len(args) > 0 {
+		return nil, cobra.ShellCompDirectiveNoFileComp
+	}
+	return config.NewConfigManager().ListWorkflowNames(), cobra.ShellCompDirectiveNoFileComp
+}
+
+// CompleteWorkflowNames is like CompleteWorkflowName for commands that take
+// any number of workflow names; names already given are not offered again.
+func CompleteWorkflowNames(_ *cobra.Command, args []string, _ string) ([]string, cobra.ShellCompDirective) {
+	names := config.NewConfigManager().ListWorkflowNames()
+	remaining := names[:0]
+	for _, name := range names {
+		if !slices.Contains(args, name) {
+			remaining = append(remaining, name)
+		}
+	}
+	return remaining, cobra.ShellCompDirectiveNoFileComp
+}
+
 // OpenInEditor opens the given file path in $EDITOR, falling back to vim → vi
 // → nano.  It exits with code 1 when no editor can be found or the editor
 // returns a non-zero exit code.
@@ -0,0 +1,57 @@
+package clihelper
+
+import (
+	"bufio"
+	"bytes"
+	"strings"
+	"testing"
+
+	"github.com/charmbracelet/huh"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestSimpleSelect(t *testing.T) {
+	out := new(bytes.Buffer)
+	got, err := simpleSelect(bufio.NewReader(strings.NewReader("2\n")), out, "Pick:", []string{"dev", "prod"})
+	require.NoError(t, err)
+	assert.Equal(t, "prod", got)
+	assert.Equal(t, "Pick:\n  1) dev\n  2) prod\n> ", out.String())
+}
+
+func TestSimpleSelect_Abort(t *testing.T) {
+	for _, input := range []string{"", "\n"} {
+		_, err := simpleSelect(bufio.NewReader(strings.NewReader(input)), new(bytes.Buffer), "Pick:", []string{"dev"})
+		assert.ErrorIs(t, err, huh.ErrUserAborted)
+	}
+}
+
+func TestSimpleSelect_Invalid(t *testing.T) {
+	for _, input := range []string{"0\n", "3\n", "dev\n"} {
+		_, err := simpleSelect(bufio.NewReader(strings.NewReader(input)), new(bytes.Buffer), "Pick:", []string{"dev", "prod"})
+		require.Error(t, err)
+		assert.Contains(t, err.Error(), "invalid choice")
+	}
+}
+
+func TestSimpleConfirm(t *testing.T) {
+	tests := map[string]bool{"y\n": true, "YES\n": true, "n\n": false, "\n": false, "": false}
+	for input, want := range tests {
+		out := new(bytes.Buffer)
+		got, err := simpleConfirm(bufio.NewReader(strings.NewReader(input)), out, "Sure?")
+		require.NoError(t, err)
+		assert.Equal(t, want, got, "input %q", input)
+		assert.Equal(t, "Sure? [y/N] ", out.String())
+	}
+}
+
+func TestSimplePrompts_ShareReader(t *testing.T) {
+	in := bufio.NewReader(strings.NewReader("1\ny\n"))
+	got, err := simpleSelect(in, new(bytes.Buffer), "Pick:", []string{"dev", "prod"})
+	require.NoError(t, err)
+	assert.Equal(t, "dev", got)
+
+	confirmed, err := simpleConfirm(in, new(bytes.Buffer), "Sure?")
+	require.NoError(t, err)
+	assert.True(t, confirmed)
+}
@@ -2,7 +2,6 @@ package add
 
 import (
 	"fmt"
-	"os"
 	"path/filepath"
 	"strings"
 
@@ -23,34 +22,23 @@ var Command = &cobra.Command{
 
 		name := args[0]
 
-		if strings.Contains(name, "/") || strings.Contains(name, "\\") {
-			return fmt.Errorf("workflow name cannot contain path separators")
-		}
-
-		if strings.HasPrefix(name, ".") {
-			return fmt.Errorf("workflow name cannot start with a dot")
-		}
-
-		if strings.Contains(name, ".") {
-			return fmt.Errorf("please provide the name without file extension")
+		if err := validateName(name); err != nil {
+			return err
 		}
 
 		fileType, _ := cobraCmd.Flags().GetString("type")
 		ext := "." + fileType
 
-		loader := config.NewConfigLoader()
+		loader := cfg.ConfigLoader()
 		if !loader.IsSupportedFormat("x" + ext) {
 			return fmt.Errorf("unsupported format: %s", fileType)
 		}
 
-		var existingExts []string
-		for _, supportedExt := range cfg.GetSupportedFormats() {
-			candidate := filepath.Join(cfg.WorkflowsDir(), name+supportedExt)
-			if _, err := os.Stat(candidate); err == nil {
-				existingExts = append(existingExts, supportedExt)
+		if existing := cfg.WorkflowFiles(name); len(existing) > 0 {
+			existingExts := make([]string, len(existing))
+			for i, path := range existing {
+				existingExts[i] = filepath.Ext(path)
 			}
-		}
-		if len(existingExts) > 0 {
 			extList := strings.Join(existingExts, ", ")
 			return fmt.Errorf("workflow '%s' already exists with extension: %s", name, extList)
 		}
@@ -86,6 +74,34 @@ var Command = &cobra.Command{
 	},
 }
 
+// nameClass flags the bytes validateName cares about, so its scan is a
+// single table lookup per byte instead of a comparison per rule.
+var nameClass = [256]uint8{'/': classSep, '\\': classSep, '.': classDot}
+
+const (
+	classSep = 1 << iota
+	classDot
+)
+
+// validateName checks a new workflow name in a single scan.  Path separators
+// are reported first, then a leading dot, then any other dot (an extension).
+func validateName(name string) error {
+	var seen uint8
+	for i := 0; i < len(name); i++ {
+		seen |= nameClass[name[i]]
+	}
+	switch {
+	case seen&classSep != 0:
+		return fmt.Errorf("workflow name cannot contain path separators")
+	case seen&classDot == 0:
+		return nil
+	case name[0] == '.':
+		return fmt.Errorf("workflow name cannot start with a dot")
+	default:
+		return fmt.Errorf("please provide the name without file extension")
+	}
+}
+
 func init() {
 	Command.Flags().BoolP("edit", "e", false, "Open the new workflow in your editor after creation")
 	Command.Flags().StringP("type", "t", "yaml", "Workflow file type (yaml, json, toml)")
@@ -184,3 +184,29 @@ func TestAdd_WorkflowNameStartingWithDot(t *testing.T) {
 	require.Error(t, err)
 	assert.Contains(t, err.Error(), "cannot start with a dot")
 }
+
+func TestValidateName(t *testing.T) {
+	tests := []struct {
+		name    string
+		wantErr string
+	}{
+		{"myflow", ""},
+		{"my-flow_2", ""},
+		{"a/b", "path separators"},
+		{"a\\b", "path separators"},
+		{".hidden/x", "path separators"},
+		{".hidden", "start with a dot"},
+		{"flow.yaml", "without file extension"},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := validateName(tt.name)
+			if tt.wantErr == "" {
+				assert.NoError(t, err)
+				return
+			}
+			require.Error(t, err)
+			assert.Contains(t, err.Error(), tt.wantErr)
+		})
+	}
+}
@@ -1,9 +1,12 @@
 package apply
 
 import (
-	"errors"
+	"context"
 	"fmt"
 	"log/slog"
+	"os"
+	"os/signal"
+	"syscall"
 
 	"github.com/dagimg-dot/floww/internal/clihelper"
 	"github.com/dagimg-dot/floww/internal/config"
@@ -18,6 +21,11 @@ type workflowApplier interface {
 	Apply(data *workflow.Workflow, append bool) bool
 }
 
+// contextApplier is implemented by appliers whose waits can be interrupted.
+type contextApplier interface {
+	ApplyContext(ctx context.Context, data *workflow.Workflow, append bool) bool
+}
+
 // wfManagerFactory is overridable in tests to inject a mock WorkflowManager.
 var wfManagerFactory func(*config.ConfigManager, workflow.WorkspaceManager, workflow.AppLauncher) workflowApplier = defaultWFManagerFactory
 
@@ -26,9 +34,10 @@ func defaultWFManagerFactory(cfg *config.ConfigManager, wsMgr workflow.Workspace
 }
 
 var Command = &cobra.Command{
-	Use:   "apply [name]",
-	Short: "Apply a workflow",
-	Args:  cobra.MaximumNArgs(1),
+	Use:               "apply [name]",
+	Short:             "Apply a workflow",
+	Args:              cobra.MaximumNArgs(1),
+	ValidArgsFunction: clihelper.CompleteWorkflowName,
 	RunE: func(cobraCmd *cobra.Command, args []string) error {
 		filePath, _ := cobraCmd.Flags().GetString("file")
 		appendMode, _ := cobraCmd.Flags().GetBool("append")
@@ -66,23 +75,39 @@ var Command = &cobra.Command{
 				displayName = "selected"
 			}
 
-			var wnfe *config.WorkflowNotFoundError
-			var cle *config.ConfigLoadError
-			var ce *config.ConfigError
-			if errors.As(err, &wnfe) || errors.As(err, &cle) || errors.As(err, &ce) {
-				return fmt.Errorf("failed to load workflow '%s': %w", displayName, err)
-			}
 			return fmt.Errorf("failed to load workflow '%s': %w", displayName, err)
 		}
 
+		// Reject schema errors before switching workspaces or spawning
+		// anything, rather than failing partway through the workflow.
+		if err := cfg.ValidateWorkflow(workflowName, workflowData); err != nil {
+			return fmt.Errorf("invalid workflow '%s': %w", workflowName, err)
+		}
+
 		slog.Info("Applying workflow", "name", workflowName)
 
 		backend := workspace.CreateBackend("", cfg)
 		wsMgr := workspace.NewWorkspaceManager(backend)
 		appLauncher := launcher.New()
+		defer appLauncher.Close() //nolint:errcheck
 		wfMgr := wfManagerFactory(cfg, wsMgr, appLauncher)
 
-		if !wfMgr.Apply(workflowData, appendMode) {
+		ctx := cobraCmd.Context()
+		if ctx == nil {
+			ctx = context.Background()
+		}
+		// Ctrl-C or SIGTERM during a wait stops the workflow before the
+		// next launch instead of leaving it to run out its timers.
+		ctx, stop := signal.NotifyContext(ctx, os.Interrupt, syscall.SIGTERM)
+		defer stop()
+
+		var ok bool
+		if ca, isCtx := wfMgr.(contextApplier); isCtx {
+			ok = ca.ApplyContext(ctx, workflowData, appendMode)
+		} else {
+			ok = wfMgr.Apply(workflowData, appendMode)
+		}
+		if !ok {
 			return fmt.Errorf("workflow application failed")
 		}
 		return nil
@@ -208,3 +208,29 @@ func TestApply_AppendFlag(t *testing.T) {
 	require.NoError(t, err)
 	assert.True(t, mock.capturedAppend, "append should be true")
 }
+
+func TestApply_InvalidWorkflowNotApplied(t *testing.T) {
+	resetCmd()
+	dir := t.TempDir()
+	t.Setenv("XDG_CONFIG_HOME", dir)
+	wfDir := setupTest(t, dir)
+	content := `workspaces:
+  - target: 1
+    apps:
+      - name: Terminal
+        exec: gnome-terminal
+      - name: Broken
+`
+	require.NoError(t, os.WriteFile(filepath.Join(wfDir, "broken.yaml"), []byte(content), 0600))
+
+	mock := &mockWFManager{applyResult: true}
+	setMockWFManager(t, mock)
+
+	Command.SetArgs([]string{"broken"})
+
+	err := Command.Execute()
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "invalid workflow 'broken'")
+	assert.Contains(t, err.Error(), "missing the required 'exec' key")
+	assert.Nil(t, mock.capturedData, "nothing should be applied")
+}
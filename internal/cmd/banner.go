@@ -0,0 +1,15 @@
+package cmd
+
+// FLOWW_ART is the ASCII art logo printed when floww runs without a
+// subcommand.  As an untyped constant it lives in the binary's read-only
+// data and costs nothing at startup for the invocations that never print it.
+const FLOWW_ART = `
+  /$$$$$$  /$$                                      
+ /$$__  $$| $$                                      
+| $$  \__/| $$  /$$$$$$  /$$  /$$  /$$ /$$  /$$  /$$
+| $$$$    | $$ /$$__  $$| $$ | $$ | $$| $$ | $$ | $$
+| $$_/    | $$| $$  \ $$| $$ | $$ | $$| $$ | $$ | $$
+| $$      | $$| $$  | $$| $$ | $$ | $$| $$ | $$ | $$
+| $$      | $$|  $$$$$$/|  $$$$$/$$$$/|  $$$$$/$$$$/
+|__/      |__/ \______/  \_____/\___/  \_____/\___/ 
+`
@@ -1,6 +1,9 @@
 package cmd
 
 import (
+	"bytes"
+	"context"
+	"log/slog"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -8,6 +11,7 @@ import (
 	"testing"
 
 	"github.com/dagimg-dot/floww/internal/config"
+	"github.com/dagimg-dot/floww/internal/utils"
 	"github.com/spf13/pflag"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
@@ -455,3 +459,72 @@ func TestApply_WithAppend(t *testing.T) {
 	out, _ := runSubTest(t)
 	assert.True(t, strings.Contains(out, "Workflow: test-workflow"))
 }
+
+func TestDispatchFast_Version(t *testing.T) {
+	for _, arg := range []string{"-v", "--version"} {
+		buf := new(bytes.Buffer)
+		assert.True(t, dispatchFast([]string{arg}, buf))
+		assert.Equal(t, utils.VersionDisplay()+"\n", buf.String())
+	}
+}
+
+func TestDispatchFast_FallsThrough(t *testing.T) {
+	buf := new(bytes.Buffer)
+	assert.False(t, dispatchFast([]string{"list"}, buf))
+	assert.False(t, dispatchFast([]string{"--version", "--log-level", "DEBUG"}, buf))
+	assert.False(t, dispatchFast(nil, buf))
+	assert.Empty(t, buf.String())
+}
+
+func TestSetupLogging_ReusesHandler(t *testing.T) {
+	SetupLogging("ERROR")
+	handler := slog.Default().Handler()
+	assert.False(t, handler.Enabled(context.Background(), slog.LevelWarn))
+
+	SetupLogging("info")
+	assert.Same(t, handler, slog.Default().Handler())
+	assert.True(t, handler.Enabled(context.Background(), slog.LevelInfo))
+
+	SetupLogging("WARNING")
+}
+
+func TestComplete_WorkflowNames(t *testing.T) {
+	dir := t.TempDir()
+	t.Setenv("XDG_CONFIG_HOME", dir)
+	cfg := config.NewConfigManager()
+	require.NoError(t, cfg.Init(false, ""))
+	loader := config.NewConfigLoader()
+	for _, name := range []string{"dev.yaml", "prod.toml"} {
+		require.NoError(t, loader.Save(validWorkflowData(), filepath.Join(cfg.WorkflowsDir(), name)))
+	}
+
+	complete := func(args ...string) string {
+		resetRootCmd()
+		buf := new(bytes.Buffer)
+		rootCmd.SetOut(buf)
+		rootCmd.SetArgs(append([]string{"__complete"}, args...))
+		require.NoError(t, rootCmd.Execute())
+		return buf.String()
+	}
+
+	out := complete("edit", "")
+	assert.Contains(t, out, "dev\n")
+	assert.Contains(t, out, "prod\n")
+
+	out = complete("edit", "dev", "")
+	assert.NotContains(t, out, "prod\n")
+
+	out = complete("remove", "dev", "")
+	assert.NotContains(t, out, "dev\n")
+	assert.Contains(t, out, "prod\n")
+}
+
+func TestRoot_PrintsBannerAndHelp(t *testing.T) {
+	resetRootCmd()
+	buf := new(bytes.Buffer)
+	rootCmd.SetOut(buf)
+	rootCmd.SetArgs([]string{})
+	require.NoError(t, rootCmd.Execute())
+	assert.True(t, strings.HasPrefix(buf.String(), FLOWW_ART))
+	assert.Contains(t, buf.String(), "Available Commands:")
+}
@@ -2,8 +2,6 @@ package edit
 
 import (
 	"fmt"
-	"os"
-	"path/filepath"
 
 	"github.com/dagimg-dot/floww/internal/clihelper"
 	"github.com/dagimg-dot/floww/internal/config"
@@ -11,9 +9,10 @@ import (
 )
 
 var Command = &cobra.Command{
-	Use:   "edit [name]",
-	Short: "Edit an existing workflow",
-	Args:  cobra.MaximumNArgs(1),
+	Use:               "edit [name]",
+	Short:             "Edit an existing workflow",
+	Args:              cobra.MaximumNArgs(1),
+	ValidArgsFunction: clihelper.CompleteWorkflowName,
 	RunE: func(cobraCmd *cobra.Command, args []string) error {
 		cfg := config.NewConfigManager()
 		if err := clihelper.CheckInitialized(cfg); err != nil {
@@ -28,12 +27,8 @@ var Command = &cobra.Command{
 		}
 
 		var workflowPath string
-		for _, ext := range cfg.GetSupportedFormats() {
-			candidate := filepath.Join(cfg.WorkflowsDir(), workflowName+ext)
-			if _, err := os.Stat(candidate); err == nil {
-				workflowPath = candidate
-				break
-			}
+		if found := cfg.WorkflowFiles(workflowName); len(found) > 0 {
+			workflowPath = found[0]
 		}
 
 		if workflowPath == "" {
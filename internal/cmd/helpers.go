@@ -1,29 +1,25 @@
 package cmd
 
 import (
-	"fmt"
 	"log/slog"
 	"os"
 	"strings"
+	"sync"
 )
 
-// FLOWW_ART is the ASCII art logo displayed on --help and init.
-const FLOWW_ART = `
-  /$$$$$$  /$$                                      
- /$$__  $$| $$                                      
-| $$  \__/| $$  /$$$$$$  /$$  /$$  /$$ /$$  /$$  /$$
-| $$$$    | $$ /$$__  $$| $$ | $$ | $$| $$ | $$ | $$
-| $$_/    | $$| $$  \ $$| $$ | $$ | $$| $$ | $$ | $$
-| $$      | $$| $$  | $$| $$ | $$ | $$| $$ | $$ | $$
-| $$      | $$|  $$$$$$/|  $$$$$/$$$$/|  $$$$$/$$$$/
-|__/      |__/ \______/  \_____/\___/  \_____/\___/ 
-`
+// logLevel is the level of the stderr handler; the handler itself is built
+// once by installLogging and later SetupLogging calls only move the level.
+var (
+	logLevel       slog.LevelVar
+	installLogging sync.Once
+)
 
 // SetupLogging configures slog with the given level name (DEBUG, INFO, WARNING,
 // ERROR).  The handler writes to stderr.  Unknown level names default to WARNING.
 func SetupLogging(levelName string) {
 	var level slog.Level
-	switch strings.ToUpper(levelName) {
+	levelName = strings.ToUpper(levelName)
+	switch levelName {
 	case "DEBUG":
 		level = slog.LevelDebug
 	case "INFO":
@@ -36,12 +32,15 @@ func SetupLogging(levelName string) {
 		level = slog.LevelWarn
 	}
 
-	handler := slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{
-		Level: level,
+	logLevel.Set(level)
+	installLogging.Do(func() {
+		handler := slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{
+			Level: &logLevel,
+		})
+		slog.SetDefault(slog.New(handler))
 	})
-	slog.SetDefault(slog.New(handler))
 
 	if level == slog.LevelDebug {
-		slog.Debug(fmt.Sprintf("Logging level set to %s", strings.ToUpper(levelName)))
+		slog.Debug("Logging level set", "level", levelName)
 	}
 }
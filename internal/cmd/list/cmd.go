@@ -11,11 +11,14 @@ var Command = &cobra.Command{
 	Short: "List available workflows",
 	RunE: func(cmd *cobra.Command, _ []string) error {
 		cfg := config.NewConfigManager()
-		if err := clihelper.CheckInitialized(cfg); err != nil {
-			return err
+		// One directory read answers both "initialised?" and "what's there?";
+		// the stat-based check only runs to word the error.
+		names, initialized := cfg.ScanWorkflowNames()
+		if !initialized {
+			if err := clihelper.CheckInitialized(cfg); err != nil {
+				return err
+			}
 		}
-
-		names := cfg.ListWorkflowNames()
 		if len(names) == 0 {
 			cmd.Println("No workflows found")
 			return nil
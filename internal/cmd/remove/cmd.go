@@ -1,33 +1,33 @@
 package remove
 
 import (
-	"errors"
 	"fmt"
 	"os"
 	"path/filepath"
 	"strings"
 
-	"github.com/charmbracelet/huh"
 	"github.com/spf13/cobra"
 
+	"github.com/dagimg-dot/floww/internal/clihelper"
 	"github.com/dagimg-dot/floww/internal/config"
 )
 
 var Command = &cobra.Command{
-	Use:   "remove [names...]",
-	Short: "Remove a workflow",
-	Long:  "Remove one or more workflow files.",
-	Args:  cobra.ArbitraryArgs,
+	Use:               "remove [names...]",
+	Short:             "Remove a workflow",
+	Long:              "Remove one or more workflow files.",
+	Args:              cobra.ArbitraryArgs,
+	ValidArgsFunction: clihelper.CompleteWorkflowNames,
 	RunE: func(cobraCmd *cobra.Command, args []string) error {
 		force, _ := cobraCmd.Flags().GetBool("force")
 		cfg := config.NewConfigManager()
-		if err := checkInitialized(cfg); err != nil {
+		if err := clihelper.CheckInitialized(cfg); err != nil {
 			return err
 		}
 
-		names := args
+		names := dedupe(args)
 		if len(names) == 0 {
-			selected := selectWorkflow(cfg, "remove")
+			selected := clihelper.SelectWorkflow(cfg, "remove")
 			names = []string{selected}
 		}
 
@@ -37,7 +37,7 @@ var Command = &cobra.Command{
 		}
 		var allFiles []fileEntry
 		for _, workflowName := range names {
-			found := findWorkflowFiles(cfg, workflowName)
+			found := cfg.WorkflowFiles(workflowName)
 			if len(found) == 0 {
 				return fmt.Errorf("workflow '%s' not found", workflowName)
 			}
@@ -54,11 +54,7 @@ var Command = &cobra.Command{
 				prompt = fmt.Sprintf("Are you sure you want to remove workflow '%s'?", names[0])
 			}
 
-			confirmed := false
-			err := huh.NewConfirm().
-				Title(prompt).
-				Value(&confirmed).
-				Run()
+			confirmed, err := clihelper.Confirm(prompt)
 			if err != nil {
 				return fmt.Errorf("confirmation failed: %w", err)
 			}
@@ -68,11 +64,17 @@ var Command = &cobra.Command{
 			}
 		}
 
+		// Collect the report and write it once; files already removed are
+		// still reported if a later removal fails.
+		var report strings.Builder
+		defer func() { cobraCmd.Print(report.String()) }()
 		for _, entry := range allFiles {
 			if err := os.Remove(entry.path); err != nil {
 				return fmt.Errorf("failed to remove workflow file: %w", err)
 			}
-			cobraCmd.Printf("Removed workflow: %s\n", filepath.Base(entry.path))
+			report.WriteString("Removed workflow: ")
+			report.WriteString(filepath.Base(entry.path))
+			report.WriteByte('\n')
 		}
 		return nil
 	},
@@ -82,52 +84,22 @@ func init() {
 	Command.Flags().BoolP("force", "f", false, "Skip confirmation prompt")
 }
 
-func checkInitialized(cfg *config.ConfigManager) error {
-	if !cfg.IsInitialized() {
-		return fmt.Errorf("floww is not initialized. Please run 'floww init' first")
+// dedupe drops repeated names, keeping the first occurrence of each, so a
+// name given twice is looked up and removed once.
+func dedupe(names []string) []string {
+	if len(names) < 2 {
+		return names
 	}
-	return nil
-}
-
-func printError(msg string) {
-	fmt.Fprintf(os.Stderr, "\033[1;31mError:\033[0m %s\n", msg)
-}
-
-func selectWorkflow(cfg *config.ConfigManager, action string) string {
-	available := cfg.ListWorkflowNames()
-	if len(available) == 0 {
-		printError(fmt.Sprintf("No workflows found to %s", action))
-		os.Exit(1)
-	}
-
-	var selected string
-	err := huh.NewSelect[string]().
-		Title(fmt.Sprintf("Select a workflow to %s:", action)).
-		Options(huh.NewOptions(available...)...).
-		Value(&selected).
-		Run()
-
-	if errors.Is(err, huh.ErrUserAborted) {
-		fmt.Println("No workflow selected")
-		os.Exit(0)
-	}
-	if err != nil {
-		printError(fmt.Sprintf("Selection failed: %v", err))
-		os.Exit(1)
-	}
-
-	return selected
-}
-
-func findWorkflowFiles(cfg *config.ConfigManager, name string) []string {
-	var found []string
-	for _, ext := range cfg.GetSupportedFormats() {
-		path := filepath.Join(cfg.WorkflowsDir(), name+ext)
-		if _, err := os.Stat(path); err == nil {
-			found = append(found, path)
+	seen := make(map[string]struct{}, len(names))
+	out := make([]string, 0, len(names))
+	for _, name := range names {
+		if _, ok := seen[name]; ok {
+			continue
 		}
+		seen[name] = struct{}{}
+		out = append(out, name)
 	}
-	return found
+	return out
 }
 
 func joinQuoted(names []string) string {
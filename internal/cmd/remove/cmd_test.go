@@ -4,6 +4,7 @@ import (
 	"bytes"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/spf13/pflag"
@@ -108,3 +109,21 @@ func TestRemove_NonexistentWorkflow(t *testing.T) {
 	require.Error(t, err)
 	assert.Contains(t, err.Error(), "not found")
 }
+
+func TestRemove_DuplicateNames(t *testing.T) {
+	resetCmd()
+	dir := t.TempDir()
+	t.Setenv("XDG_CONFIG_HOME", dir)
+	wfDir := setupTest(t, dir)
+
+	file := createWorkflow(t, wfDir, "foo.yaml")
+
+	buf := new(bytes.Buffer)
+	Command.SetOut(buf)
+	Command.SetArgs([]string{"foo", "foo", "--force"})
+
+	err := Command.Execute()
+	require.NoError(t, err)
+	assert.Equal(t, 1, strings.Count(buf.String(), "Removed workflow: foo.yaml"))
+	assert.NoFileExists(t, file)
+}
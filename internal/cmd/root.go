@@ -2,6 +2,7 @@ package cmd
 
 import (
 	"fmt"
+	"io"
 	"os"
 
 	"github.com/dagimg-dot/floww/internal/cmd/add"
@@ -19,7 +20,7 @@ var rootCmd = &cobra.Command{
 	Use:   "floww",
 	Short: "floww - your workflow automations in one place",
 	Run: func(cmd *cobra.Command, args []string) {
-		fmt.Print(FLOWW_ART)
+		_, _ = io.WriteString(cmd.OutOrStdout(), FLOWW_ART)
 		_ = cmd.Help()
 	},
 	PersistentPreRunE: func(cmd *cobra.Command, args []string) error {
@@ -46,8 +47,36 @@ func init() {
 	rootCmd.AddCommand(apply.Command)
 }
 
+// fastPaths maps single-argument invocations that need neither the command
+// tree, flag parsing, nor logging setup to their handlers.
+var fastPaths = map[string]func(io.Writer){
+	"-v":        printVersion,
+	"--version": printVersion,
+}
+
+func printVersion(w io.Writer) {
+	_, _ = fmt.Fprintln(w, utils.VersionDisplay())
+}
+
+// dispatchFast runs the fast-path handler for args, if any.  It returns false
+// when args must go through cobra.
+func dispatchFast(args []string, w io.Writer) bool {
+	if len(args) != 1 {
+		return false
+	}
+	handler, ok := fastPaths[args[0]]
+	if !ok {
+		return false
+	}
+	handler(w)
+	return true
+}
+
 // Execute runs the root command and exits on error.
 func Execute() {
+	if dispatchFast(os.Args[1:], os.Stdout) {
+		return
+	}
 	if err := rootCmd.Execute(); err != nil {
 		os.Exit(1)
 	}
@@ -18,12 +18,13 @@ var useColorFunc = func() bool {
 }
 
 var Command = &cobra.Command{
-	Use:           "validate [name]",
-	Short:         "Validate a workflow file",
-	Long:          "Validate a workflow's schema without applying it.",
-	Args:          cobra.MaximumNArgs(1),
-	SilenceErrors: true,
-	SilenceUsage:  true,
+	Use:               "validate [name]",
+	Short:             "Validate a workflow file",
+	Long:              "Validate a workflow's schema without applying it.",
+	Args:              cobra.MaximumNArgs(1),
+	ValidArgsFunction: clihelper.CompleteWorkflowName,
+	SilenceErrors:     true,
+	SilenceUsage:      true,
 	RunE: func(cobraCmd *cobra.Command, args []string) error {
 		filePath, _ := cobraCmd.Flags().GetString("file")
 
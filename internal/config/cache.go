@@ -0,0 +1,86 @@
+package config
+
+import (
+	"container/list"
+	"os"
+	"sync"
+	"time"
+
+	"github.com/dagimg-dot/floww/internal/workflow"
+)
+
+// maxCachedWorkflows bounds the parsed-workflow cache.
+const maxCachedWorkflows = 100
+
+// workflowCache holds parsed workflows for the lifetime of the process so a
+// file loaded more than once is decoded once.  An entry is only reused while the file's modification
+// time and size are unchanged.
+var workflowCache = newParseCache(maxCachedWorkflows)
+
+type cacheEntry struct {
+	path    string
+	modTime time.Time
+	size    int64
+	wf      *workflow.Workflow
+}
+
+// parseCache is a small LRU of parsed workflows keyed by path.  Workflows
+// returned by get are deep copies, so callers may modify what they get; put
+// keeps the workflow it is given, since a process usually loads a workflow
+// once and copying it on the way in would be wasted.
+type parseCache struct {
+	mu      sync.Mutex
+	max     int
+	order   *list.List // front is most recently used
+	entries map[string]*list.Element
+}
+
+func newParseCache(maxEntries int) *parseCache {
+	return &parseCache{
+		max:     maxEntries,
+		order:   list.New(),
+		entries: make(map[string]*list.Element),
+	}
+}
+
+// get returns a copy of the workflow cached for path if info still matches
+// the file it was parsed from.
+func (c *parseCache) get(path string, info os.FileInfo) (*workflow.Workflow, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	el, ok := c.entries[path]
+	if !ok {
+		return nil, false
+	}
+	e, ok := el.Value.(*cacheEntry)
+	if !ok || !e.modTime.Equal(info.ModTime()) || e.size != info.Size() {
+		c.order.Remove(el)
+		delete(c.entries, path)
+		return nil, false
+	}
+	c.order.MoveToFront(el)
+	return e.wf.Clone(), true
+}
+
+// put stores wf for path, evicting the least recently used entry once the
+// cache is full.  wf is shared with the caller, which must only make edits
+// that later loads may see (ValidateWorkflow filling in the default app
+// type is the one such edit today).
+func (c *parseCache) put(path string, info os.FileInfo, wf *workflow.Workflow) {
+	e := &cacheEntry{path: path, modTime: info.ModTime(), size: info.Size(), wf: wf}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if el, ok := c.entries[path]; ok {
+		el.Value = e
+		c.order.MoveToFront(el)
+		return
+	}
+	c.entries[path] = c.order.PushFront(e)
+	if c.order.Len() > c.max {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		if e, ok := oldest.Value.(*cacheEntry); ok {
+			delete(c.entries, e.path)
+		}
+	}
+}
@@ -0,0 +1,93 @@
+package config
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/dagimg-dot/floww/internal/workflow"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestParseCache_HitReturnsCopy(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "wf.yaml")
+	require.NoError(t, os.WriteFile(path, []byte("description: x\n"), 0600))
+	info, err := os.Stat(path)
+	require.NoError(t, err)
+
+	c := newParseCache(2)
+	c.put(path, info, &workflow.Workflow{Description: "x"})
+
+	got, ok := c.get(path, info)
+	require.True(t, ok)
+	got.Description = "changed"
+
+	again, ok := c.get(path, info)
+	require.True(t, ok)
+	assert.Equal(t, "x", again.Description)
+}
+
+func TestParseCache_InvalidatedByChange(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "wf.yaml")
+	require.NoError(t, os.WriteFile(path, []byte("description: x\n"), 0600))
+	info, err := os.Stat(path)
+	require.NoError(t, err)
+
+	c := newParseCache(2)
+	c.put(path, info, &workflow.Workflow{Description: "x"})
+
+	later := info.ModTime().Add(time.Second)
+	require.NoError(t, os.Chtimes(path, later, later))
+	info, err = os.Stat(path)
+	require.NoError(t, err)
+
+	_, ok := c.get(path, info)
+	assert.False(t, ok)
+	assert.Empty(t, c.entries)
+}
+
+func TestParseCache_EvictsLeastRecentlyUsed(t *testing.T) {
+	dir := t.TempDir()
+	var infos []os.FileInfo
+	var paths []string
+	for _, name := range []string{"a.yaml", "b.yaml", "c.yaml"} {
+		path := filepath.Join(dir, name)
+		require.NoError(t, os.WriteFile(path, []byte("{}"), 0600))
+		info, err := os.Stat(path)
+		require.NoError(t, err)
+		paths = append(paths, path)
+		infos = append(infos, info)
+	}
+
+	c := newParseCache(2)
+	c.put(paths[0], infos[0], &workflow.Workflow{})
+	c.put(paths[1], infos[1], &workflow.Workflow{})
+	_, _ = c.get(paths[0], infos[0])
+	c.put(paths[2], infos[2], &workflow.Workflow{})
+
+	_, ok := c.get(paths[1], infos[1])
+	assert.False(t, ok, "b was least recently used")
+	_, ok = c.get(paths[0], infos[0])
+	assert.True(t, ok)
+	_, ok = c.get(paths[2], infos[2])
+	assert.True(t, ok)
+}
+
+func TestLoadWorkflow_ReloadsModifiedFile(t *testing.T) {
+	dir := t.TempDir()
+	cm := NewConfigManager(dir)
+	require.NoError(t, cm.Init(false, ""))
+	createValidWorkflowWithDesc(t, cm.workflowsDir, "dev.yaml", 1, "first")
+
+	wf, err := cm.LoadWorkflow("dev", false)
+	require.NoError(t, err)
+	assert.Equal(t, "first", wf.Description)
+
+	createValidWorkflowWithDesc(t, cm.workflowsDir, "dev.yaml", 2, "second")
+	wf, err = cm.LoadWorkflow("dev", false)
+	require.NoError(t, err)
+	assert.Equal(t, "second", wf.Description)
+	assert.Len(t, wf.Workspaces, 2)
+}
@@ -1,13 +1,16 @@
 package config
 
 import (
-	"encoding/json"
+	"errors"
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
+	"slices"
 	"sort"
 	"strings"
 	"sync"
+	"time"
 
 	"github.com/dagimg-dot/floww/internal/utils"
 	"github.com/dagimg-dot/floww/internal/workflow"
@@ -22,7 +25,20 @@ type ConfigManager struct {
 	workflowsDir string
 	loader       *ConfigLoader
 	config       *utils.DefaultConfig
+	configLoaded bool
 	mu           sync.RWMutex
+
+	// files is a snapshot of the workflows directory's file names, read once
+	// by WorkflowFiles.
+	filesOnce sync.Once
+	files     map[string]struct{}
+
+	// names caches ScanWorkflowNames, valid while the workflows directory's
+	// modification time still equals namesModTime.
+	namesMu      sync.Mutex
+	namesCached  bool
+	namesModTime time.Time
+	names        []string
 }
 
 // NewConfigManager creates a new ConfigManager.
@@ -60,12 +76,8 @@ func NewConfigManager(configPath ...string) *ConfigManager {
 
 	cm.workflowsDir = filepath.Join(cm.configDir, "workflows")
 
-	defaults := utils.DefaultConfigValues
-	cm.config = &defaults
-
-	// Load and merge user config from disk; falls back to defaults silently.
-	_ = cm.loadAndMergeConfig()
-
+	// The user config is loaded and merged on first use by mergedConfig, so
+	// commands that never read it (init, list, add, ...) skip the file.
 	return cm
 }
 
@@ -98,8 +110,33 @@ func (cm *ConfigManager) Init(createExample bool, fileType string) error {
 	return nil
 }
 
+// defaultConfigYAML is what yaml.Marshal produces for the default config, so
+// a YAML config file can be written without running the encoder.
+const defaultConfigYAML = `general:
+    show_notifications: true
+    workspace_backend: auto
+timing:
+    app_launch_wait: 1
+    respect_app_wait: true
+    workspace_switch_wait: 3
+`
+
 func (cm *ConfigManager) writeDefaultConfig() error {
-	data := map[string]any{
+	var err error
+	switch strings.ToLower(filepath.Ext(cm.configPath)) {
+	case ".yaml", ".yml":
+		err = os.WriteFile(cm.configPath, []byte(defaultConfigYAML), 0666) //nolint:gosec // same mode Save uses
+	default:
+		err = cm.loader.Save(defaultConfigMap(), cm.configPath)
+	}
+	if err != nil {
+		return fmt.Errorf("failed to create config file: %w", err)
+	}
+	return nil
+}
+
+func defaultConfigMap() map[string]any {
+	return map[string]any{
 		"general": map[string]any{
 			"show_notifications": true,
 			"workspace_backend":  "auto",
@@ -110,10 +147,6 @@ func (cm *ConfigManager) writeDefaultConfig() error {
 			"respect_app_wait":      true,
 		},
 	}
-	if err := cm.loader.Save(data, cm.configPath); err != nil {
-		return fmt.Errorf("failed to create config file: %w", err)
-	}
-	return nil
 }
 
 func (cm *ConfigManager) writeExampleWorkflow(fileType string) error {
@@ -137,40 +170,64 @@ func (cm *ConfigManager) writeExampleWorkflow(fileType string) error {
 }
 
 // IsInitialized returns true when both the config directory and the workflows
-// sub-directory exist.
+// sub-directory exist.  The workflows directory lives inside the config
+// directory, so one stat of it answers for both.
 func (cm *ConfigManager) IsInitialized() bool {
-	info, err := os.Stat(cm.configDir)
-	if err != nil || !info.IsDir() {
-		return false
-	}
-	info, err = os.Stat(cm.workflowsDir)
-	if err != nil || !info.IsDir() {
-		return false
-	}
-	return true
+	info, err := os.Stat(cm.workflowsDir)
+	return err == nil && info.IsDir()
 }
 
 // ListWorkflowNames scans the workflows directory, collects all recognised
 // workflow files, deduplicates by stem (same stem in multiple formats counts
 // once), and returns the sorted list of names.
 func (cm *ConfigManager) ListWorkflowNames() []string {
-	entries, err := os.ReadDir(cm.workflowsDir)
+	names, _ := cm.ScanWorkflowNames()
+	return names
+}
+
+// ScanWorkflowNames is ListWorkflowNames that also reports whether floww is
+// initialised.  Reading the workflows directory succeeds exactly when both it
+// and the config directory above it exist, so callers that need both answers
+// get them from one directory read instead of IsInitialized's extra stats.
+//
+// The result is cached per ConfigManager and reused until the directory's
+// modification time changes, which happens whenever a file is added, removed
+// or renamed in it.
+func (cm *ConfigManager) ScanWorkflowNames() ([]string, bool) {
+	info, err := os.Stat(cm.workflowsDir)
 	if err != nil {
-		return nil
+		return nil, false
 	}
 
-	seen := make(map[string]bool)
+	cm.namesMu.Lock()
+	defer cm.namesMu.Unlock()
+	if cm.namesCached && info.ModTime().Equal(cm.namesModTime) {
+		return slices.Clone(cm.names), true
+	}
+
+	// Read entries in directory order: os.ReadDir would sort every entry by
+	// name only for the stems to be sorted again below.
+	dir, err := os.Open(cm.workflowsDir)
+	if err != nil {
+		return nil, false
+	}
+	entries, err := dir.ReadDir(-1)
+	_ = dir.Close()
+	if err != nil {
+		return nil, false
+	}
+
+	seen := make(map[string]bool, len(entries))
 	var names []string
 
 	for _, entry := range entries {
 		if entry.IsDir() {
 			continue
 		}
-		name := entry.Name()
-		if !cm.loader.IsSupportedFormat(name) {
+		stem, ok := workflowStem(entry.Name())
+		if !ok {
 			continue
 		}
-		stem := strings.TrimSuffix(name, filepath.Ext(name))
 		if !seen[stem] {
 			seen[stem] = true
 			names = append(names, stem)
@@ -178,7 +235,36 @@ func (cm *ConfigManager) ListWorkflowNames() []string {
 	}
 
 	sort.Strings(names)
-	return names
+	cm.names, cm.namesModTime, cm.namesCached = names, info.ModTime(), true
+	return slices.Clone(names), true
+}
+
+// WorkflowFiles returns the paths of every file stored for the workflow name,
+// one per supported extension, in format priority order (.toml → .yaml →
+// .yml → .json).  The workflows directory is read once per ConfigManager, so
+// checking several names or extensions costs a single directory read instead
+// of one stat per candidate.
+func (cm *ConfigManager) WorkflowFiles(name string) []string {
+	cm.filesOnce.Do(func() {
+		entries, err := os.ReadDir(cm.workflowsDir)
+		if err != nil {
+			return
+		}
+		cm.files = make(map[string]struct{}, len(entries))
+		for _, entry := range entries {
+			if !entry.IsDir() {
+				cm.files[entry.Name()] = struct{}{}
+			}
+		}
+	})
+
+	var found []string
+	for _, ext := range supportedFormats {
+		if _, ok := cm.files[name+ext]; ok {
+			found = append(found, filepath.Join(cm.workflowsDir, name+ext))
+		}
+	}
+	return found
 }
 
 // ResolveWorkflowPath resolves a workflow name to a file path within the
@@ -186,13 +272,20 @@ func (cm *ConfigManager) ListWorkflowNames() []string {
 // (.toml → .yaml → .yml → .json). Returns *WorkflowNotFoundError when no
 // matching file exists.
 func (cm *ConfigManager) ResolveWorkflowPath(name string) (string, error) {
-	for _, ext := range cm.loader.GetSupportedFormats() {
+	path, _, err := cm.resolveWorkflow(name)
+	return path, err
+}
+
+// resolveWorkflow is ResolveWorkflowPath that also returns the file's stat
+// result, so loading the file does not need to stat it a second time.
+func (cm *ConfigManager) resolveWorkflow(name string) (string, os.FileInfo, error) {
+	for _, ext := range supportedFormats {
 		candidate := filepath.Join(cm.workflowsDir, name+ext)
-		if _, err := os.Stat(candidate); err == nil {
-			return candidate, nil
+		if info, err := os.Stat(candidate); err == nil {
+			return candidate, info, nil
 		}
 	}
-	return "", &WorkflowNotFoundError{
+	return "", nil, &WorkflowNotFoundError{
 		ConfigError: ConfigError{
 			FlowwError: FlowwError{
 				Msg: fmt.Sprintf("Workflow '%s' not found", name),
@@ -207,9 +300,11 @@ func (cm *ConfigManager) ResolveWorkflowPath(name string) (string, error) {
 // directory.  The loaded workflow is validated before being returned.
 func (cm *ConfigManager) LoadWorkflow(name string, isDirectLoad bool) (*workflow.Workflow, error) {
 	var path string
+	var info os.FileInfo
 
 	if isDirectLoad {
-		if _, err := os.Stat(name); err == nil {
+		var err error
+		if info, err = os.Stat(name); err == nil {
 			path = name
 		} else {
 			return nil, &WorkflowNotFoundError{
@@ -222,50 +317,37 @@ func (cm *ConfigManager) LoadWorkflow(name string, isDirectLoad bool) (*workflow
 		}
 	} else {
 		var err error
-		path, err = cm.ResolveWorkflowPath(name)
+		path, info, err = cm.resolveWorkflow(name)
 		if err != nil {
 			return nil, err
 		}
 	}
 
-	return cm.loadWorkflowFile(path)
+	return cm.loadWorkflowFile(path, info)
 }
 
-// loadWorkflowFile reads a workflow file at the given path, parses it into a
-// Workflow struct, and validates it.
-func (cm *ConfigManager) loadWorkflowFile(path string) (*workflow.Workflow, error) {
-	raw, err := cm.loader.Load(path)
-	if err != nil {
-		return nil, &ConfigLoadError{
-			ConfigError: ConfigError{
-				FlowwError: FlowwError{
-					Msg:   fmt.Sprintf("failed to load workflow file '%s'", path),
-					Cause: err,
-				},
-			},
-		}
-	}
-
-	// Round-trip through JSON to convert the generic map to a typed struct.
-	// This works because every supported format can be represented as JSON,
-	// and the Workflow struct has json struct tags.
-	encoded, err := json.Marshal(raw)
-	if err != nil {
-		return nil, fmt.Errorf("failed to marshal workflow data: %w", err)
+// loadWorkflowFile reads a workflow file at the given path and decodes it
+// straight into a Workflow struct.  info is the file's stat result from
+// resolving the path.  Files unchanged since they were last decoded are
+// served from workflowCache.
+func (cm *ConfigManager) loadWorkflowFile(path string, info os.FileInfo) (*workflow.Workflow, error) {
+	if wf, ok := workflowCache.get(path, info); ok {
+		return wf, nil
 	}
 
 	var wf workflow.Workflow
-	if err := json.Unmarshal(encoded, &wf); err != nil {
+	if err := cm.loader.Decode(path, &wf); err != nil {
 		return nil, &ConfigLoadError{
 			ConfigError: ConfigError{
 				FlowwError: FlowwError{
-					Msg:   fmt.Sprintf("failed to parse workflow file '%s'", path),
+					Msg:   fmt.Sprintf("failed to load workflow file '%s'", path),
 					Cause: err,
 				},
 			},
 		}
 	}
 
+	workflowCache.put(path, info, &wf)
 	return &wf, nil
 }
 
@@ -276,16 +358,12 @@ func (cm *ConfigManager) ValidateWorkflow(name string, data *workflow.Workflow)
 
 // GetConfig returns a read-only pointer to the current merged configuration.
 func (cm *ConfigManager) GetConfig() *utils.DefaultConfig {
-	cm.mu.RLock()
-	defer cm.mu.RUnlock()
-	return cm.config
+	return cm.mergedConfig()
 }
 
 // GetTimingConfig returns a read-only pointer to the timing sub-section.
 func (cm *ConfigManager) GetTimingConfig() *utils.TimingConfig {
-	cm.mu.RLock()
-	defer cm.mu.RUnlock()
-	return &cm.config.Timing
+	return &cm.mergedConfig().Timing
 }
 
 // ConfigPath returns the resolved config file path.
@@ -300,75 +378,108 @@ func (cm *ConfigManager) ConfigDir() string {
 
 // GetGeneralConfig returns a read-only pointer to the general sub-section.
 func (cm *ConfigManager) GetGeneralConfig() *utils.GeneralConfig {
-	cm.mu.RLock()
-	defer cm.mu.RUnlock()
-	return &cm.config.General
+	return &cm.mergedConfig().General
 }
 
-// loadAndMergeConfig loads the user's config file from disk and deep-merges
-// it with the hard-coded defaults.  Unknown or invalid values revert to the
-// corresponding default.  This method is safe for concurrent callers.
-func (cm *ConfigManager) loadAndMergeConfig() error {
+// mergedConfig returns the merged configuration, loading it from disk the
+// first time it is needed.  User config errors fall back to the defaults
+// silently.
+func (cm *ConfigManager) mergedConfig() *utils.DefaultConfig {
+	cm.mu.RLock()
+	cfg, loaded := cm.config, cm.configLoaded
+	cm.mu.RUnlock()
+	if loaded {
+		return cfg
+	}
+
 	cm.mu.Lock()
 	defer cm.mu.Unlock()
+	if !cm.configLoaded {
+		cm.mergeConfigLocked()
+	}
+	return cm.config
+}
 
+// mergeConfigLocked loads the user's config file from disk and deep-merges
+// it with the hard-coded defaults.  Unknown or invalid values revert to the
+// corresponding default, and a config file that cannot be read or parsed
+// leaves the defaults in place.  cm.mu must be held for writing.
+func (cm *ConfigManager) mergeConfigLocked() {
 	merged := utils.DefaultConfigValues
+	cm.config, cm.configLoaded = &merged, true
 
 	raw, err := cm.loadMainConfigFile()
 	if err != nil {
-		cm.config = &merged
-		return nil
+		return
 	}
 
-	if generalRaw, ok := raw["general"]; ok {
-		if general, ok := generalRaw.(map[string]any); ok {
-			if v, ok := general["show_notifications"]; ok {
-				if b, ok := v.(bool); ok {
-					merged.General.ShowNotifications = b
-				}
-			}
-			if v, ok := general["workspace_backend"]; ok {
-				if s, ok := v.(string); ok {
-					if utils.ValidWorkspaceBackends[s] {
-						merged.General.WorkspaceBackend = s
-					}
-				}
+	if general, ok := raw["general"].(map[string]any); ok {
+		for key, v := range general {
+			if set, ok := generalSetters[key]; ok {
+				set(&merged.General, v)
 			}
 		}
 	}
 
-	if timingRaw, ok := raw["timing"]; ok {
-		if timing, ok := timingRaw.(map[string]any); ok {
-			if v, ok := timing["workspace_switch_wait"]; ok {
-				if f, convOk := toFloat64(v); convOk && f >= 0 {
-					merged.Timing.WorkspaceSwitchWait = f
-				}
-			}
-			if v, ok := timing["app_launch_wait"]; ok {
-				if f, convOk := toFloat64(v); convOk && f >= 0 {
-					merged.Timing.AppLaunchWait = f
-				}
-			}
-			if v, ok := timing["respect_app_wait"]; ok {
-				if b, ok := v.(bool); ok {
-					merged.Timing.RespectAppWait = b
-				}
+	if timing, ok := raw["timing"].(map[string]any); ok {
+		for key, v := range timing {
+			if set, ok := timingSetters[key]; ok {
+				set(&merged.Timing, v)
 			}
 		}
 	}
+}
 
-	cm.config = &merged
-	return nil
+// generalSetters and timingSetters map each recognised user config key to the
+// function that validates its value and stores it.  Values of the wrong type
+// or out of range are ignored, leaving the default in place; unknown keys have
+// no entry and are skipped.
+var generalSetters = map[string]func(*utils.GeneralConfig, any){
+	"show_notifications": func(g *utils.GeneralConfig, v any) {
+		if b, ok := v.(bool); ok {
+			g.ShowNotifications = b
+		}
+	},
+	"workspace_backend": func(g *utils.GeneralConfig, v any) {
+		if s, ok := v.(string); ok && utils.ValidWorkspaceBackends[s] {
+			g.WorkspaceBackend = s
+		}
+	},
+}
+
+var timingSetters = map[string]func(*utils.TimingConfig, any){
+	"workspace_switch_wait": func(t *utils.TimingConfig, v any) {
+		if f, ok := nonNegativeFloat(v); ok {
+			t.WorkspaceSwitchWait = f
+		}
+	},
+	"app_launch_wait": func(t *utils.TimingConfig, v any) {
+		if f, ok := nonNegativeFloat(v); ok {
+			t.AppLaunchWait = f
+		}
+	},
+	"respect_app_wait": func(t *utils.TimingConfig, v any) {
+		if b, ok := v.(bool); ok {
+			t.RespectAppWait = b
+		}
+	},
+}
+
+func nonNegativeFloat(v any) (float64, bool) {
+	f, ok := toFloat64(v)
+	return f, ok && f >= 0
 }
 
 // loadMainConfigFile finds and loads the user's config file.
 //
 // The search order is:
 //  1. config.yaml (preferred — checked first regardless of extension order)
-//  2. config.toml, config.yaml (skipped), config.yml, config.json
+//  2. config.toml, config.yml, config.json
 //
 // The config base is derived by stripping the extension from configPath (or
-// using it verbatim when there is no extension).
+// using it verbatim when there is no extension).  Each candidate is simply
+// loaded and skipped when missing, so the common case costs one open and no
+// separate stat.
 func (cm *ConfigManager) loadMainConfigFile() (map[string]any, error) {
 	base := cm.configPath
 	ext := filepath.Ext(base)
@@ -376,24 +487,19 @@ func (cm *ConfigManager) loadMainConfigFile() (map[string]any, error) {
 		base = strings.TrimSuffix(base, ext)
 	}
 
-	yamlPath := base + ".yaml"
-	if _, err := os.Stat(yamlPath); err == nil {
-		return cm.loader.Load(yamlPath)
-	}
-
-	for _, ext := range cm.loader.GetSupportedFormats() {
-		if ext == ".yaml" {
-			continue
-		}
-		path := base + ext
-		if _, err := os.Stat(path); err == nil {
-			return cm.loader.Load(path)
+	for _, ext := range configSearchOrder {
+		raw, err := cm.loader.Load(base + ext)
+		if !errors.Is(err, fs.ErrNotExist) {
+			return raw, err
 		}
 	}
 
 	return nil, fmt.Errorf("config file not found at %s.{yaml,toml,yml,json}", base)
 }
 
+// configSearchOrder is supportedFormats with .yaml moved to the front.
+var configSearchOrder = [...]string{".yaml", ".toml", ".yml", ".json"}
+
 // WorkflowsDir returns the absolute path to the workflows directory.
 func (cm *ConfigManager) WorkflowsDir() string {
 	return cm.workflowsDir
@@ -411,6 +517,19 @@ func (cm *ConfigManager) GetSupportedFormats() []string {
 	return cm.loader.GetSupportedFormats()
 }
 
+// workflowStem returns name without its workflow extension, matched
+// case-insensitively against supportedFormats, and reports whether it had one.
+// It allocates nothing, which matters when it runs once per directory entry.
+func workflowStem(name string) (string, bool) {
+	for _, ext := range supportedFormats {
+		n := len(name) - len(ext)
+		if n >= 0 && strings.EqualFold(name[n:], ext) {
+			return name[:n], true
+		}
+	}
+	return "", false
+}
+
 func toFloat64(v any) (float64, bool) {
 	switch n := v.(type) {
 	case float64:
@@ -4,11 +4,13 @@ import (
 	"os"
 	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/dagimg-dot/floww/internal/utils"
 	"github.com/dagimg-dot/floww/internal/workflow"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
+	"gopkg.in/yaml.v3"
 )
 
 func TestNewConfigManager_DefaultPath(t *testing.T) {
@@ -77,6 +79,12 @@ func TestInit_CreatesDirectoriesAndConfig(t *testing.T) {
 	assert.True(t, info.Mode().IsRegular())
 }
 
+func TestInit_DefaultConfigMatchesEncoder(t *testing.T) {
+	out, err := yaml.Marshal(defaultConfigMap())
+	require.NoError(t, err)
+	assert.Equal(t, string(out), defaultConfigYAML)
+}
+
 func TestInit_WithExample(t *testing.T) {
 	dir := t.TempDir()
 	cm := NewConfigManager(dir)
@@ -205,6 +213,41 @@ func TestListWorkflowNames_IgnoresNonWorkflowFiles(t *testing.T) {
 	assert.Equal(t, []string{"dev"}, names)
 }
 
+func TestListWorkflowNames_CachedUntilDirChanges(t *testing.T) {
+	dir := t.TempDir()
+	cm := NewConfigManager(dir)
+	_ = cm.Init(false, "")
+
+	wfDir := cm.workflowsDir
+	createWorkflowFile(t, wfDir, "dev.yaml", "desc")
+
+	names := cm.ListWorkflowNames()
+	require.Equal(t, []string{"dev"}, names)
+	names[0] = "mutated"
+	assert.Equal(t, []string{"dev"}, cm.ListWorkflowNames())
+
+	createWorkflowFile(t, wfDir, "ops.yaml", "desc")
+	later := time.Now().Add(time.Second)
+	require.NoError(t, os.Chtimes(wfDir, later, later))
+	assert.Equal(t, []string{"dev", "ops"}, cm.ListWorkflowNames())
+}
+
+func TestWorkflowStem(t *testing.T) {
+	for name, want := range map[string]string{
+		"dev.yaml":   "dev",
+		"Dev.YAML":   "Dev",
+		"a.b.toml":   "a.b",
+		"ops.yml":    "ops",
+		"x.json":     "x",
+		"readme.txt": "",
+		"yaml":       "",
+	} {
+		stem, ok := workflowStem(name)
+		assert.Equal(t, want != "", ok, name)
+		assert.Equal(t, want, stem, name)
+	}
+}
+
 func TestListWorkflowNames_Uninitialized(t *testing.T) {
 	dir := t.TempDir()
 	cm := NewConfigManager(filepath.Join(dir, "does-not-exist"))
@@ -333,11 +376,24 @@ func TestGetGeneralConfig(t *testing.T) {
 	assert.Equal(t, &utils.DefaultConfigValues.General, general)
 }
 
-func TestLoadAndMergeConfig_DefaultsWhenNoFile(t *testing.T) {
+func TestGetConfig_LoadsOnFirstUse(t *testing.T) {
 	dir := t.TempDir()
-	cm := NewConfigManager(dir)
+	cfgPath := filepath.Join(dir, "config.yaml")
+	cm := NewConfigManager(cfgPath)
+
+	// Written after construction: the manager must not have read it yet.
+	err := cm.loader.Save(map[string]any{
+		"general": map[string]any{"workspace_backend": "hyprland"},
+	}, cfgPath)
+	require.NoError(t, err)
+
+	assert.Equal(t, "hyprland", cm.GetGeneralConfig().WorkspaceBackend)
+	assert.Same(t, cm.GetConfig(), cm.GetConfig())
+}
 
-	_ = cm.loadAndMergeConfig()
+func TestGetConfig_DefaultsWhenNoFile(t *testing.T) {
+	dir := t.TempDir()
+	cm := NewConfigManager(dir)
 
 	cfg := cm.GetConfig()
 	assert.Equal(t, float64(3), cfg.Timing.WorkspaceSwitchWait)
@@ -345,7 +401,7 @@ func TestLoadAndMergeConfig_DefaultsWhenNoFile(t *testing.T) {
 	assert.True(t, cfg.General.ShowNotifications)
 }
 
-func TestLoadAndMergeConfig_MergesConfigFile(t *testing.T) {
+func TestGetConfig_MergesConfigFile(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -362,9 +418,6 @@ func TestLoadAndMergeConfig_MergesConfigFile(t *testing.T) {
 	err := cm.loader.Save(configData, cfgPath)
 	require.NoError(t, err)
 
-	err = cm.loadAndMergeConfig()
-	require.NoError(t, err)
-
 	cfg := cm.GetConfig()
 	assert.False(t, cfg.General.ShowNotifications)
 	assert.Equal(t, "hyprland", cfg.General.WorkspaceBackend)
@@ -373,7 +426,7 @@ func TestLoadAndMergeConfig_MergesConfigFile(t *testing.T) {
 	assert.True(t, cfg.Timing.RespectAppWait)
 }
 
-func TestLoadAndMergeConfig_TimingNegativeValue(t *testing.T) {
+func TestGetConfig_TimingNegativeValue(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -387,14 +440,12 @@ func TestLoadAndMergeConfig_TimingNegativeValue(t *testing.T) {
 	err := cm.loader.Save(configData, cfgPath)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.Equal(t, float64(3), cfg.Timing.WorkspaceSwitchWait)
 	assert.Equal(t, float64(1), cfg.Timing.AppLaunchWait)
 }
 
-func TestLoadAndMergeConfig_TimingNonNumeric(t *testing.T) {
+func TestGetConfig_TimingNonNumeric(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -408,14 +459,12 @@ func TestLoadAndMergeConfig_TimingNonNumeric(t *testing.T) {
 	err := cm.loader.Save(configData, cfgPath)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.Equal(t, float64(3), cfg.Timing.WorkspaceSwitchWait)
 	assert.Equal(t, float64(1), cfg.Timing.AppLaunchWait)
 }
 
-func TestLoadAndMergeConfig_NonBoolRespectAppWait(t *testing.T) {
+func TestGetConfig_NonBoolRespectAppWait(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -428,13 +477,11 @@ func TestLoadAndMergeConfig_NonBoolRespectAppWait(t *testing.T) {
 	err := cm.loader.Save(configData, cfgPath)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.True(t, cfg.Timing.RespectAppWait)
 }
 
-func TestLoadAndMergeConfig_InvalidBackend(t *testing.T) {
+func TestGetConfig_InvalidBackend(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -447,13 +494,11 @@ func TestLoadAndMergeConfig_InvalidBackend(t *testing.T) {
 	err := cm.loader.Save(configData, cfgPath)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.Equal(t, "auto", cfg.General.WorkspaceBackend)
 }
 
-func TestLoadAndMergeConfig_ConfigYamlPreferred(t *testing.T) {
+func TestGetConfig_ConfigYamlPreferred(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -475,13 +520,11 @@ func TestLoadAndMergeConfig_ConfigYamlPreferred(t *testing.T) {
 	err = cm.loader.Save(tomlData, tomlPath)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.Equal(t, "hyprland", cfg.General.WorkspaceBackend)
 }
 
-func TestLoadAndMergeConfig_ConfigTomlFallback(t *testing.T) {
+func TestGetConfig_ConfigTomlFallback(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -495,13 +538,11 @@ func TestLoadAndMergeConfig_ConfigTomlFallback(t *testing.T) {
 	err := cm.loader.Save(tomlData, tomlPath)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.Equal(t, "niri", cfg.General.WorkspaceBackend)
 }
 
-func TestLoadAndMergeConfig_TimingInt64FromTOML(t *testing.T) {
+func TestGetConfig_TimingInt64FromTOML(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.toml")
 	cm := NewConfigManager(cfgPath)
@@ -519,8 +560,6 @@ workspace_backend = "wmctrl"
 	err := os.WriteFile(tomlPath, tomlContent, 0600)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.Equal(t, float64(7), cfg.Timing.WorkspaceSwitchWait)
 	assert.Equal(t, float64(2), cfg.Timing.AppLaunchWait)
@@ -528,7 +567,7 @@ workspace_backend = "wmctrl"
 	assert.Equal(t, "wmctrl", cfg.General.WorkspaceBackend)
 }
 
-func TestLoadAndMergeConfig_JSONConfig(t *testing.T) {
+func TestGetConfig_JSONConfig(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.json")
 	cm := NewConfigManager(cfgPath)
@@ -541,13 +580,11 @@ func TestLoadAndMergeConfig_JSONConfig(t *testing.T) {
 	err := cm.loader.Save(jsonData, cfgPath)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
-
 	cfg := cm.GetConfig()
 	assert.False(t, cfg.General.ShowNotifications)
 }
 
-func TestLoadAndMergeConfig_EmptyConfig(t *testing.T) {
+func TestGetConfig_EmptyConfig(t *testing.T) {
 	dir := t.TempDir()
 	cfgPath := filepath.Join(dir, "config.yaml")
 	cm := NewConfigManager(cfgPath)
@@ -555,7 +592,17 @@ func TestLoadAndMergeConfig_EmptyConfig(t *testing.T) {
 	err := os.WriteFile(cfgPath, []byte{}, 0600)
 	require.NoError(t, err)
 
-	_ = cm.loadAndMergeConfig()
+	cfg := cm.GetConfig()
+	assert.Equal(t, utils.DefaultConfigValues, *cfg)
+}
+
+func TestGetConfig_UnreadableConfigFallsBackToDefaults(t *testing.T) {
+	dir := t.TempDir()
+	cfgPath := filepath.Join(dir, "config.yaml")
+	cm := NewConfigManager(cfgPath)
+
+	err := os.WriteFile(cfgPath, []byte("general: [unclosed\n"), 0600)
+	require.NoError(t, err)
 
 	cfg := cm.GetConfig()
 	assert.Equal(t, utils.DefaultConfigValues, *cfg)
@@ -614,3 +661,36 @@ func createValidWorkflowWithDesc(t *testing.T, dir, name string, wsCount int, de
 	err := loader.Save(data, filepath.Join(dir, name))
 	require.NoError(t, err)
 }
+
+func TestWorkflowFiles(t *testing.T) {
+	dir := t.TempDir()
+	cm := NewConfigManager(dir)
+	require.NoError(t, cm.Init(false, ""))
+
+	createValidWorkflowFile(t, cm.workflowsDir, "multi.json", 1)
+	createValidWorkflowFile(t, cm.workflowsDir, "multi.toml", 1)
+	createValidWorkflowFile(t, cm.workflowsDir, "single.yml", 1)
+	require.NoError(t, os.Mkdir(filepath.Join(cm.workflowsDir, "dir.yaml"), 0750))
+
+	assert.Equal(t, []string{
+		filepath.Join(cm.workflowsDir, "multi.toml"),
+		filepath.Join(cm.workflowsDir, "multi.json"),
+	}, cm.WorkflowFiles("multi"))
+	assert.Equal(t, []string{filepath.Join(cm.workflowsDir, "single.yml")}, cm.WorkflowFiles("single"))
+	assert.Empty(t, cm.WorkflowFiles("dir"))
+	assert.Empty(t, cm.WorkflowFiles("missing"))
+}
+
+func TestScanWorkflowNames_ReportsInitialized(t *testing.T) {
+	dir := t.TempDir()
+	cm := NewConfigManager(dir)
+
+	names, ok := cm.ScanWorkflowNames()
+	assert.False(t, ok)
+	assert.Nil(t, names)
+
+	require.NoError(t, cm.Init(false, ""))
+	names, ok = cm.ScanWorkflowNames()
+	assert.True(t, ok)
+	assert.Empty(t, names)
+}
@@ -11,84 +11,110 @@ import (
 	"gopkg.in/yaml.v3"
 )
 
+// supportedFormats lists the recognised extensions in priority order.  It is
+// shared read-only by every loader and by the lookups in ConfigManager;
+// GetSupportedFormats hands out copies.
+var supportedFormats = [...]string{".toml", ".yaml", ".yml", ".json"}
+
 // ConfigLoader provides format-agnostic loading and saving of configuration
-// files in YAML, JSON, and TOML formats. Dispatch happens by file extension.
-type ConfigLoader struct {
-	loaders    map[string]func(string) (map[string]any, error)
-	savers     map[string]func(map[string]any, string) error
-	extensions []string // ordered list of supported extensions
-}
+// files in YAML, JSON, and TOML formats. Dispatch happens by file extension,
+// in a switch over the supported formats, so a loader carries no state.
+type ConfigLoader struct{}
 
-// NewConfigLoader creates a ConfigLoader with dispatch maps for
-// .toml, .yaml, .yml, and .json extensions.
+// NewConfigLoader creates a ConfigLoader for .toml, .yaml, .yml, and .json
+// files.
 func NewConfigLoader() *ConfigLoader {
-	cl := &ConfigLoader{
-		loaders:    make(map[string]func(string) (map[string]any, error)),
-		savers:     make(map[string]func(map[string]any, string) error),
-		extensions: []string{".toml", ".yaml", ".yml", ".json"},
-	}
-	cl.loaders[".toml"] = cl.loadTOML
-	cl.loaders[".yaml"] = cl.loadYAML
-	cl.loaders[".yml"] = cl.loadYAML
-	cl.loaders[".json"] = cl.loadJSON
-
-	cl.savers[".toml"] = cl.saveTOML
-	cl.savers[".yaml"] = cl.saveYAML
-	cl.savers[".yml"] = cl.saveYAML
-	cl.savers[".json"] = cl.saveJSON
-
-	return cl
+	return &ConfigLoader{}
 }
 
 // Load reads a configuration file and returns its contents as a map.
 // The file format is determined by its extension (case-insensitive).
 func (cl *ConfigLoader) Load(path string) (map[string]any, error) {
-	ext := strings.ToLower(filepath.Ext(path))
-	if ext == "" {
+	var result map[string]any
+	var err error
+	// No existence pre-check: a missing file surfaces from the read itself.
+	switch ext := strings.ToLower(filepath.Ext(path)); ext {
+	case ".toml":
+		result, err = cl.loadTOML(path)
+	case ".yaml", ".yml":
+		result, err = cl.loadYAML(path)
+	case ".json":
+		result, err = cl.loadJSON(path)
+	default:
 		return nil, fmt.Errorf("unsupported configuration format: %s", ext)
 	}
+	if os.IsNotExist(err) {
+		return nil, &fileNotFoundError{path: path, err: err}
+	}
+	return result, err
+}
 
-	loader, ok := cl.loaders[ext]
-	if !ok {
-		return nil, fmt.Errorf("unsupported configuration format: %s", ext)
+// Decode reads a configuration file and decodes it directly into out, which
+// must be a pointer. Unlike Load it skips the intermediate generic map, so
+// typed callers avoid a second conversion pass.
+func (cl *ConfigLoader) Decode(path string, out any) error {
+	var decode func([]byte, any) error
+	switch ext := strings.ToLower(filepath.Ext(path)); ext {
+	case ".toml":
+		decode = toml.Unmarshal
+	case ".yaml", ".yml":
+		decode = yaml.Unmarshal
+	case ".json":
+		decode = json.Unmarshal
+	default:
+		return fmt.Errorf("unsupported configuration format: %s", ext)
 	}
 
-	if _, err := os.Stat(path); os.IsNotExist(err) {
-		return nil, fmt.Errorf("file not found: %s", path)
+	data, err := os.ReadFile(path) //nolint:gosec // Intentional file open
+	if err != nil {
+		if os.IsNotExist(err) {
+			return &fileNotFoundError{path: path, err: err}
+		}
+		return err
 	}
 
-	return loader(path)
+	return decode(data, out)
+}
+
+// fileNotFoundError is returned by Load and Decode for a missing file.  It
+// unwraps to the underlying *fs.PathError, so errors.Is(err, fs.ErrNotExist)
+// holds.
+type fileNotFoundError struct {
+	path string
+	err  error
 }
 
+func (e *fileNotFoundError) Error() string { return "file not found: " + e.path }
+
+func (e *fileNotFoundError) Unwrap() error { return e.err }
+
 // Save writes the configuration data to a file in the format determined
 // by the file's extension (case-insensitive).
 func (cl *ConfigLoader) Save(data map[string]any, path string) error {
-	ext := strings.ToLower(filepath.Ext(path))
-	if ext == "" {
+	switch ext := strings.ToLower(filepath.Ext(path)); ext {
+	case ".toml":
+		return cl.saveTOML(data, path)
+	case ".yaml", ".yml":
+		return cl.saveYAML(data, path)
+	case ".json":
+		return cl.saveJSON(data, path)
+	default:
 		return fmt.Errorf("unsupported configuration format: %s", ext)
 	}
-
-	saver, ok := cl.savers[ext]
-	if !ok {
-		return fmt.Errorf("unsupported configuration format: %s", ext)
-	}
-
-	return saver(data, path)
 }
 
 // GetSupportedFormats returns the list of supported file extensions in order:
 // .toml, .yaml, .yml, .json.
 func (cl *ConfigLoader) GetSupportedFormats() []string {
-	result := make([]string, len(cl.extensions))
-	copy(result, cl.extensions)
+	result := make([]string, len(supportedFormats))
+	copy(result, supportedFormats[:])
 	return result
 }
 
 // IsSupportedFormat returns true if the given file path has a supported
 // configuration file extension (case-insensitive).
 func (cl *ConfigLoader) IsSupportedFormat(path string) bool {
-	ext := strings.ToLower(filepath.Ext(path))
-	_, ok := cl.loaders[ext]
+	_, ok := workflowStem(path)
 	return ok
 }
 
@@ -98,6 +124,11 @@ func (cl *ConfigLoader) loadYAML(path string) (map[string]any, error) {
 		return nil, err
 	}
 
+	// Small flat files like config.yaml are handled without the full decoder.
+	if result, ok := parseSimpleYAML(data); ok {
+		return result, nil
+	}
+
 	var result map[string]any
 	if err := yaml.Unmarshal(data, &result); err != nil {
 		return nil, err
@@ -110,18 +141,15 @@ func (cl *ConfigLoader) loadYAML(path string) (map[string]any, error) {
 }
 
 func (cl *ConfigLoader) saveYAML(data map[string]any, path string) error {
-	f, err := os.Create(path) //nolint:gosec // Intentional file create
+	// Marshal in memory and write once: the streaming encoder only flushed
+	// on Close, whose error was dropped along with the file's.
+	// default_flow_style=False equivalent: yaml.v3 uses block style by default
+	// sort_keys=False equivalent: yaml.v3 does not sort keys by default
+	out, err := yaml.Marshal(data)
 	if err != nil {
 		return err
 	}
-	defer f.Close() //nolint:errcheck
-
-	encoder := yaml.NewEncoder(f)
-	defer encoder.Close() //nolint:errcheck
-
-	// default_flow_style=False equivalent: yaml.v3 uses block style by default
-	// sort_keys=False equivalent: yaml.v3 does not sort keys by default
-	return encoder.Encode(data)
+	return os.WriteFile(path, out, 0666) //nolint:gosec // same mode os.Create used
 }
 
 func (cl *ConfigLoader) loadJSON(path string) (map[string]any, error) {
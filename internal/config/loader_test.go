@@ -1,6 +1,7 @@
 package config
 
 import (
+	"io/fs"
 	"os"
 	"path/filepath"
 	"testing"
@@ -154,6 +155,44 @@ func TestLoader_NonexistentFile(t *testing.T) {
 	assert.Error(t, err)
 	assert.Contains(t, err.Error(), "file not found:")
 	assert.Contains(t, err.Error(), "/nonexistent/path/config.yaml")
+	assert.ErrorIs(t, err, fs.ErrNotExist)
+}
+
+func TestLoader_Decode(t *testing.T) {
+	type doc struct {
+		Name  string `yaml:"name" json:"name" toml:"name"`
+		Count int    `yaml:"count" json:"count" toml:"count"`
+	}
+	dir := t.TempDir()
+	files := map[string]string{
+		"a.yaml": "name: x\ncount: 2\n",
+		"a.json": `{"name": "x", "count": 2}`,
+		"a.toml": "name = \"x\"\ncount = 2\n",
+	}
+	cl := NewConfigLoader()
+	for name, content := range files {
+		t.Run(name, func(t *testing.T) {
+			path := filepath.Join(dir, name)
+			require.NoError(t, os.WriteFile(path, []byte(content), 0600))
+
+			var got doc
+			require.NoError(t, cl.Decode(path, &got))
+			assert.Equal(t, doc{Name: "x", Count: 2}, got)
+		})
+	}
+}
+
+func TestLoader_DecodeErrors(t *testing.T) {
+	cl := NewConfigLoader()
+	var out map[string]any
+
+	err := cl.Decode("/tmp/test.unsupported", &out)
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "unsupported configuration format: .unsupported")
+
+	err = cl.Decode("/nonexistent/path/config.yaml", &out)
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "file not found:")
 }
 
 func TestLoader_CaseInsensitiveExtension(t *testing.T) {
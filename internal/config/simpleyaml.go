@@ -0,0 +1,167 @@
+package config
+
+import (
+	"bytes"
+	"strconv"
+	"strings"
+)
+
+// parseSimpleYAML decodes the one shape floww's own config file has: top-level
+// sections, each holding plain "key: value" scalars, e.g.
+//
+//	general:
+//	    show_notifications: true
+//	timing:
+//	    workspace_switch_wait: 3
+//
+// Values become bool, int, float64 or string exactly as yaml.v3 would decode
+// them.  Anything outside that subset (flow style, quotes, trailing comments,
+// lists, tabs, ambiguous scalars, ...) makes it report false so the caller can
+// fall back to the full YAML decoder.
+func parseSimpleYAML(data []byte) (map[string]any, bool) {
+	result := make(map[string]any)
+	var section map[string]any
+	indent := 0
+
+	for len(data) > 0 {
+		var line []byte
+		if i := bytes.IndexByte(data, '\n'); i >= 0 {
+			line, data = data[:i], data[i+1:]
+		} else {
+			line, data = data, nil
+		}
+
+		n := 0
+		for n < len(line) && line[n] == ' ' {
+			n++
+		}
+		rest := line[n:]
+		if len(rest) == 0 || rest[0] == '#' {
+			continue
+		}
+
+		if n == 0 {
+			key, ok := simpleSectionKey(rest)
+			if !ok || section != nil && len(section) == 0 {
+				return nil, false
+			}
+			if _, dup := result[key]; dup {
+				return nil, false
+			}
+			section = make(map[string]any)
+			result[key] = section
+			indent = 0
+			continue
+		}
+
+		if section == nil || indent != 0 && n != indent {
+			return nil, false
+		}
+		indent = n
+		key, value, ok := simpleScalar(rest)
+		if !ok {
+			return nil, false
+		}
+		if _, dup := section[key]; dup {
+			return nil, false
+		}
+		section[key] = value
+	}
+
+	if len(result) == 0 || len(section) == 0 {
+		return nil, false
+	}
+	return result, true
+}
+
+// simpleSectionKey accepts "key:" with nothing after the colon but spaces.
+func simpleSectionKey(line []byte) (string, bool) {
+	i := bytes.IndexByte(line, ':')
+	if i <= 0 || !isSimpleKey(line[:i]) || len(bytes.TrimRight(line[i+1:], " ")) != 0 {
+		return "", false
+	}
+	return string(line[:i]), true
+}
+
+// simpleScalar accepts "key: value" with a single space-free value.
+func simpleScalar(line []byte) (string, any, bool) {
+	i := bytes.IndexByte(line, ':')
+	if i <= 0 || !isSimpleKey(line[:i]) {
+		return "", nil, false
+	}
+	rest := line[i+1:]
+	if len(rest) == 0 || rest[0] != ' ' {
+		return "", nil, false
+	}
+	token := bytes.TrimRight(bytes.TrimLeft(rest, " "), " ")
+	if len(token) == 0 || bytes.IndexByte(token, ' ') >= 0 {
+		return "", nil, false
+	}
+	value, ok := simpleValue(string(token))
+	return string(line[:i]), value, ok
+}
+
+func isSimpleKey(key []byte) bool {
+	for _, c := range key {
+		if (c < 'a' || c > 'z') && c != '_' {
+			return false
+		}
+	}
+	return len(key) > 0
+}
+
+// simpleValue types a scalar the way yaml.v3 does for the forms it accepts:
+// true/false, decimal integers and fractions without leading zeros, and
+// lower-case words that YAML does not treat specially.
+func simpleValue(token string) (any, bool) {
+	switch token {
+	case "true":
+		return true, true
+	case "false":
+		return false, true
+	}
+
+	digits := token
+	if digits[0] == '-' {
+		digits = digits[1:]
+	}
+	if digits != "" && digits[0] >= '0' && digits[0] <= '9' {
+		whole, frac, isFrac := strings.Cut(digits, ".")
+		if !allDigits(whole) || len(whole) > 1 && whole[0] == '0' {
+			return nil, false
+		}
+		if !isFrac {
+			n, err := strconv.Atoi(token)
+			return n, err == nil
+		}
+		if !allDigits(frac) {
+			return nil, false
+		}
+		f, err := strconv.ParseFloat(token, 64)
+		return f, err == nil
+	}
+
+	if token[0] < 'a' || token[0] > 'z' {
+		return nil, false
+	}
+	for i := 1; i < len(token); i++ {
+		c := token[i]
+		if (c < 'a' || c > 'z') && (c < '0' || c > '9') && c != '_' && c != '-' {
+			return nil, false
+		}
+	}
+	switch token {
+	case "null", "yes", "no", "on", "off", "y", "n":
+		return nil, false
+	}
+	return token, true
+}
+
+func allDigits(s string) bool {
+	for i := 0; i < len(s); i++ {
+		if s[i] < '0' || s[i] > '9' {
+			return false
+		}
+	}
+	return s != ""
+}
@@ -0,0 +1,50 @@
+package config
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"gopkg.in/yaml.v3"
+)
+
+func TestParseSimpleYAML_MatchesDecoder(t *testing.T) {
+	inputs := []string{
+		defaultConfigYAML,
+		"general:\n  workspace_backend: hyprland\n",
+		"# comment\ntiming:\n  app_launch_wait: 0.5\n\n  workspace_switch_wait: -2\n",
+		"general:\n    show_notifications: false\ntiming:\n    respect_app_wait: true",
+	}
+	for _, in := range inputs {
+		got, ok := parseSimpleYAML([]byte(in))
+		require.True(t, ok, in)
+
+		var want map[string]any
+		require.NoError(t, yaml.Unmarshal([]byte(in), &want))
+		assert.Equal(t, want, got, in)
+	}
+}
+
+func TestParseSimpleYAML_FallsBack(t *testing.T) {
+	inputs := []string{
+		"",
+		"general:\n",
+		"general: {show_notifications: true}\n",
+		"general:\n  workspace_backend: \"auto\"\n",
+		"general:\n  workspace_backend: auto # trailing\n",
+		"general:\n  show_notifications: yes\n",
+		"general:\n  show_notifications: True\n",
+		"timing:\n  app_launch_wait: 01\n",
+		"timing:\n  app_launch_wait: 1e3\n",
+		"timing:\n  app_launch_wait: 1\n    respect_app_wait: true\n",
+		"timing:\n\tapp_launch_wait: 1\n",
+		"timing:\n  app_launch_wait: 1\n  app_launch_wait: 2\n",
+		"timing:\n  nested:\n    app_launch_wait: 1\n",
+		"apps:\n  - name: x\n",
+		"---\ngeneral:\n  show_notifications: true\n",
+	}
+	for _, in := range inputs {
+		_, ok := parseSimpleYAML([]byte(in))
+		assert.False(t, ok, in)
+	}
+}
@@ -9,6 +9,7 @@ import (
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/dagimg-dot/floww/internal/diagnostic"
 	"github.com/dagimg-dot/floww/internal/workflow"
@@ -29,8 +30,18 @@ type ValidationResult struct {
 // an error is returned only for infrastructure failures (missing file,
 // unsupported extension).
 func (cm *ConfigManager) ValidateWorkflowFile(path string) (*ValidationResult, error) {
-	if !cm.loader.IsSupportedFormat(path) {
-		return nil, fmt.Errorf("unsupported configuration format: %s", filepath.Ext(path))
+	// The extension is derived once and picks the parser up front.
+	var parse func([]byte) (*workflow.Workflow, *Positions, []diagnostic.Diagnostic)
+	ext := filepath.Ext(path)
+	switch strings.ToLower(ext) {
+	case ".yaml", ".yml":
+		parse = parseWorkflowYAML
+	case ".json":
+		parse = parseWorkflowJSON
+	case ".toml":
+		parse = parseWorkflowTOML
+	default:
+		return nil, fmt.Errorf("unsupported configuration format: %s", ext)
 	}
 
 	data, err := os.ReadFile(path) //nolint:gosec // Intentional file open
@@ -47,19 +58,7 @@ func (cm *ConfigManager) ValidateWorkflowFile(path string) (*ValidationResult, e
 		return nil, err
 	}
 
-	var wf *workflow.Workflow
-	var positions *Positions
-	var diags []diagnostic.Diagnostic
-
-	switch strings.ToLower(filepath.Ext(path)) {
-	case ".yaml", ".yml":
-		wf, positions, diags = parseWorkflowYAML(data)
-	case ".json":
-		wf, positions, diags = parseWorkflowJSON(data)
-	case ".toml":
-		wf, positions, diags = parseWorkflowTOML(data)
-	}
-
+	wf, positions, diags := parse(data)
 	if len(diags) > 0 {
 		return &ValidationResult{Source: data, Diagnostics: diags}, nil
 	}
@@ -98,7 +97,11 @@ func parseWorkflowYAML(data []byte) (*workflow.Workflow, *Positions, []diagnosti
 	return &wf, buildPositionsFromYAML(&doc), nil
 }
 
-var yamlLineRe = regexp.MustCompile(`line (\d+)`)
+// yamlLineRe is compiled on first use rather than at package init: only the
+// YAML error path needs it, and every command links this package.
+var yamlLineRe = sync.OnceValue(func() *regexp.Regexp {
+	return regexp.MustCompile(`line (\d+)`)
+})
 
 func yamlSyntaxDiagnostic(err error) diagnostic.Diagnostic {
 	return diagnostic.Diagnostic{Message: err.Error(), Position: yamlPosition(err.Error())}
@@ -110,7 +113,7 @@ func yamlLineNumber(msg string) int {
 
 func yamlPosition(msg string) diagnostic.Position {
 	pos := diagnostic.Position{}
-	if m := yamlLineRe.FindStringSubmatch(msg); m != nil {
+	if m := yamlLineRe().FindStringSubmatch(msg); m != nil {
 		if line, err := strconv.Atoi(m[1]); err == nil {
 			pos.Line = line
 		}
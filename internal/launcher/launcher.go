@@ -3,11 +3,14 @@ package launcher
 
 import (
 	"errors"
+	"log/slog"
 	"os"
 	"os/exec"
 	"os/user"
 	"path/filepath"
 	"strings"
+	"sync"
+	"syscall"
 
 	"github.com/dagimg-dot/floww/internal/config"
 	"github.com/dagimg-dot/floww/internal/workflow"
@@ -16,9 +19,21 @@ import (
 // AppLauncher launches applications of various types (binary, flatpak, snap)
 // with subprocess.Popen-like semantics (detached, stdout/stderr to /dev/null).
 //
-// RunCommand can be overridden for testing; when nil exec.Command is used.
+// RunCommand can be overridden for testing; when nil processes are started
+// with os.StartProcess.
 type AppLauncher struct {
 	RunCommand func(name string, arg ...string) *exec.Cmd
+
+	// paths caches $PATH lookups so a workflow launching the same executable
+	// several times (e.g. many flatpak apps) searches $PATH once.
+	mu    sync.Mutex
+	paths map[string]string
+
+	// devNull is opened on the first launch and shared by every child's
+	// stdin, stdout and stderr until Close.
+	devNullOnce sync.Once
+	devNull     *os.File
+	devNullErr  error
 }
 
 // New creates a new AppLauncher with default settings.
@@ -26,46 +41,170 @@ func New() *AppLauncher {
 	return &AppLauncher{}
 }
 
-func (l *AppLauncher) command(name string, arg ...string) *exec.Cmd {
+// Close releases the shared /dev/null handle, if one was opened.
+func (l *AppLauncher) Close() error {
+	if l.devNull == nil {
+		return nil
+	}
+	return l.devNull.Close()
+}
+
+func (l *AppLauncher) nullDevice() (*os.File, error) {
+	l.devNullOnce.Do(func() {
+		l.devNull, l.devNullErr = os.OpenFile(os.DevNull, os.O_RDWR, 0)
+	})
+	return l.devNull, l.devNullErr
+}
+
+// start spawns argv detached, in a new session, with every standard stream
+// on devNull.  Without a RunCommand override it calls os.StartProcess
+// directly: the exec.Cmd layer adds nothing when the child's stdio are plain
+// files and it is never waited on.
+func (l *AppLauncher) start(argv []string, devNull *os.File) error {
+	// Start the child in its own session (start_new_session semantics) so it
+	// survives the terminal floww was run from.
 	if l.RunCommand != nil {
-		return l.RunCommand(name, arg...)
+		c := l.RunCommand(argv[0], argv[1:]...)
+		c.Stdin, c.Stdout, c.Stderr = devNull, devNull, devNull
+		if c.SysProcAttr == nil {
+			c.SysProcAttr = &syscall.SysProcAttr{}
+		}
+		c.SysProcAttr.Setsid = true
+		if err := c.Start(); err != nil {
+			return err
+		}
+		// The child is never waited on; drop our handle to it right away.
+		_ = c.Process.Release()
+		return nil
+	}
+
+	path := l.lookPath(argv[0])
+	if path == argv[0] && !strings.ContainsRune(path, filepath.Separator) {
+		// Like exec.Command, never run a bare name from the working directory.
+		return &exec.Error{Name: argv[0], Err: exec.ErrNotFound}
+	}
+	p, err := os.StartProcess(path, argv, &os.ProcAttr{
+		Files: []*os.File{devNull, devNull, devNull},
+		Sys:   &syscall.SysProcAttr{Setsid: true},
+	})
+	if err != nil {
+		return err
+	}
+	_ = p.Release()
+	return nil
+}
+
+// lookPath resolves a bare executable name against $PATH, remembering the
+// result. Names containing a path separator and names that fail to resolve
+// are returned unchanged; start reports the latter as not found.
+func (l *AppLauncher) lookPath(name string) string {
+	if strings.ContainsRune(name, filepath.Separator) {
+		return name
+	}
+	l.mu.Lock()
+	defer l.mu.Unlock()
+	if p, ok := l.paths[name]; ok {
+		return p
+	}
+	p, err := exec.LookPath(name)
+	if err != nil {
+		return name
 	}
-	return exec.Command(name, arg...) //nolint:gosec // Intentional app launcher
+	if l.paths == nil {
+		l.paths = make(map[string]string)
+	}
+	l.paths[name] = p
+	return p
+}
+
+// argvBuilders maps each app type to the function that builds its command
+// line, so dispatch is a single lookup and new types need no extra branches.
+var argvBuilders = map[string]func(app workflow.App) []string{
+	"binary":  directArgv,
+	"flatpak": flatpakArgv,
+	"snap":    directArgv,
 }
 
+// directArgv runs app.Exec itself (binary and snap apps).
+func directArgv(app workflow.App) []string {
+	argv := make([]string, 0, 1+len(app.Args))
+	argv = append(argv, app.Exec)
+	return append(argv, app.Args...)
+}
+
+// flatpakArgv runs the app through "flatpak run <app.Exec>".
+func flatpakArgv(app workflow.App) []string {
+	argv := make([]string, 0, len(flatpakPrefix)+1+len(app.Args))
+	argv = append(argv, flatpakPrefix[:]...)
+	argv = append(argv, app.Exec)
+	return append(argv, app.Args...)
+}
+
+var flatpakPrefix = [...]string{"flatpak", "run"}
+
 // LaunchApp dispatches an app launch by type.
 //   - binary: launches app.Exec directly with app.Args
 //   - flatpak: runs "flatpak run <app.Exec> [app.Args...]"
 //   - snap: launches app.Exec (snap name) directly with app.Args
 //
+// An empty type means binary.
+//
 // Returns (true, nil) on success.
 // Returns (false, *config.AppLaunchError) when the executable is not found.
-// Returns (false, nil) for all other launch errors.
+// Returns (false, nil) for unknown app types and all other launch errors.
 func (l *AppLauncher) LaunchApp(app workflow.App) (bool, error) {
 	appType := app.Type
 	if appType == "" {
 		appType = "binary"
 	}
 
-	var cmdArgs []string
-	switch appType {
-	case "flatpak":
-		cmdArgs = append([]string{"flatpak", "run", app.Exec}, app.Args...)
-	case "snap":
-		cmdArgs = append([]string{app.Exec}, app.Args...)
-	default: // "binary"
-		cmdArgs = append([]string{app.Exec}, app.Args...)
+	build, ok := argvBuilders[appType]
+	if !ok {
+		slog.Error("Unknown app type", "app", app.Name, "type", appType)
+		return false, nil
 	}
 
-	return l.LaunchProcess(cmdArgs)
+	return l.LaunchProcess(build(app))
+}
+
+// maxParallelLaunches bounds how many apps LaunchApps starts at once, so a
+// large workspace does not flood the window manager with new clients.
+const maxParallelLaunches = 8
+
+// LaunchApps launches apps concurrently, at most maxParallelLaunches at a
+// time, and returns their results in the same order. Each launch is dominated
+// by the spawn syscalls, so a batch takes about as long as its slowest launch
+// rather than the sum of all.
+func (l *AppLauncher) LaunchApps(apps []workflow.App) []workflow.LaunchResult {
+	results := make([]workflow.LaunchResult, len(apps))
+	workers := min(maxParallelLaunches, len(apps))
+	next := make(chan int)
+	var wg sync.WaitGroup
+	wg.Add(workers)
+	for w := 0; w < workers; w++ {
+		go func() {
+			defer wg.Done()
+			for i := range next {
+				results[i].Launched, results[i].Err = l.LaunchApp(apps[i])
+			}
+		}()
+	}
+	for i := range apps {
+		next <- i
+	}
+	close(next)
+	wg.Wait()
+	return results
 }
 
 // LaunchProcess launches a command detached from the parent process,
-// with stdout and stderr redirected to /dev/null.
+// with stdin, stdout and stderr connected to /dev/null.
 //
 // Tilde (~) is expanded in all arguments using the current user's home directory.
-// The process is started with Start() (not Run()) so the call returns immediately
-// without waiting for the child to exit.
+// The process is started in a new session and never waited on, so the call
+// returns as soon as the child exists. On Linux os.StartProcess spawns via
+// clone(CLONE_VM|CLONE_VFORK), so the cost does not grow with floww's own
+// memory footprint.
 //
 // Returns (true, nil) on success.
 // Returns (false, *config.AppLaunchError) when the executable is not found.
@@ -75,24 +214,16 @@ func (l *AppLauncher) LaunchProcess(cmd []string) (bool, error) {
 		return false, nil
 	}
 
-	// Expand ~ in all elements.
-	expanded := make([]string, len(cmd))
-	for i, arg := range cmd {
-		expanded[i] = expandTilde(arg)
-	}
+	expanded := expandArgs(cmd)
 
-	c := l.command(expanded[0], expanded[1:]...)
-
-	// Redirect stdout/stderr to /dev/null (subprocess.Popen semantics).
-	devNull, err := os.OpenFile(os.DevNull, os.O_WRONLY, 0)
+	// Redirect stdin/stdout/stderr to /dev/null (subprocess.Popen semantics)
+	// through the launcher's shared handle, so a launch opens no files.
+	devNull, err := l.nullDevice()
 	if err != nil {
 		return false, nil
 	}
-	defer devNull.Close() //nolint:errcheck
-	c.Stdout = devNull
-	c.Stderr = devNull
 
-	if err := c.Start(); err != nil {
+	if err := l.start(expanded, devNull); err != nil {
 		// Distinguish file-not-found from other launch errors.
 		if errors.Is(err, exec.ErrNotFound) {
 			return false, &config.AppLaunchError{
@@ -117,20 +248,74 @@ func (l *AppLauncher) LaunchProcess(cmd []string) (bool, error) {
 	return true, nil
 }
 
-// expandTilde replaces a leading "~" or "~/" prefix with the current user's
-// home directory. If the path does not start with "~" or the user lookup
-// fails, the original path is returned unchanged.
+// expandArgs expands a leading tilde in every element of cmd in a single pass.
+// A quick prefix scan finds the first element starting with "~"; when there is
+// none, as for most commands, cmd itself is returned and nothing else is set
+// up.
+func expandArgs(cmd []string) []string {
+	first := -1
+	for i, arg := range cmd {
+		if strings.HasPrefix(arg, "~") {
+			first = i
+			break
+		}
+	}
+	if first < 0 {
+		return cmd
+	}
+
+	out := cmd
+	for i := first; i < len(cmd); i++ {
+		expanded := expandTilde(cmd[i])
+		if expanded == cmd[i] {
+			continue
+		}
+		if &out[0] == &cmd[0] {
+			out = make([]string, len(cmd))
+			copy(out, cmd)
+		}
+		out[i] = expanded
+	}
+	return out
+}
+
+// expandTilde expands a leading "~" (the current user's home directory) or
+// "~name" (that user's home directory) in path. Paths without a leading tilde,
+// or whose user cannot be looked up, are returned unchanged.
 func expandTilde(path string) string {
 	if !strings.HasPrefix(path, "~") {
 		return path
 	}
-	usr, err := user.Current()
-	if err != nil {
+	name, rest, _ := strings.Cut(path[1:], "/")
+	var home string
+	if name == "" {
+		home = ownHomeDir()
+	} else if usr, err := user.Lookup(name); err == nil {
+		home = usr.HomeDir
+	}
+	if home == "" {
 		return path
 	}
-	home := usr.HomeDir
-	if path == "~" {
+	if rest == "" {
 		return home
 	}
-	return filepath.Join(home, path[1:])
+	return filepath.Join(home, rest)
+}
+
+// ownHomeDir is homeDir resolved once per process: every launch in a workflow
+// expands "~" against the same directory.
+var ownHomeDir = sync.OnceValue(homeDir)
+
+// homeDir returns the current user's home directory, or "" if it cannot be
+// determined.  $HOME is used when set, as shells do for "~"; the password
+// database is only consulted without it.
+func homeDir() string {
+	if home, err := os.UserHomeDir(); err == nil {
+		return home
+	}
+	usr, err := user.Current()
+	if err != nil {
+		return ""
+	}
+	return usr.HomeDir
 }
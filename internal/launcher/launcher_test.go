@@ -3,7 +3,10 @@ package launcher
 import (
 	"os"
 	"os/exec"
+	"os/user"
+	"sync"
 	"testing"
+	"time"
 
 	"github.com/dagimg-dot/floww/internal/config"
 	"github.com/dagimg-dot/floww/internal/workflow"
@@ -66,6 +69,84 @@ func TestLaunchApp_DefaultType(t *testing.T) {
 	assert.NoError(t, err)
 }
 
+func TestLaunchApps_OrderedResults(t *testing.T) {
+	var mu sync.Mutex
+	var launched []string
+	l := &AppLauncher{
+		RunCommand: func(name string, arg ...string) *exec.Cmd {
+			mu.Lock()
+			launched = append(launched, name)
+			mu.Unlock()
+			if name == "missing" {
+				return exec.Command("this-command-does-not-exist-99999")
+			}
+			return exec.Command("true")
+		},
+	}
+	apps := []workflow.App{
+		{Name: "a", Exec: "a"},
+		{Name: "missing", Exec: "missing"},
+		{Name: "c", Exec: "c", Type: "appimage"},
+		{Name: "d", Exec: "d"},
+	}
+
+	results := l.LaunchApps(apps)
+	require.Len(t, results, 4)
+	assert.True(t, results[0].Launched)
+	assert.False(t, results[1].Launched)
+	assert.Error(t, results[1].Err)
+	assert.False(t, results[2].Launched)
+	assert.NoError(t, results[2].Err)
+	assert.True(t, results[3].Launched)
+	assert.ElementsMatch(t, []string{"a", "missing", "d"}, launched)
+}
+
+func TestLaunchApps_BoundedConcurrency(t *testing.T) {
+	var mu sync.Mutex
+	inFlight, peak := 0, 0
+	l := &AppLauncher{
+		RunCommand: func(name string, arg ...string) *exec.Cmd {
+			mu.Lock()
+			inFlight++
+			peak = max(peak, inFlight)
+			mu.Unlock()
+			time.Sleep(5 * time.Millisecond)
+			mu.Lock()
+			inFlight--
+			mu.Unlock()
+			return exec.Command("true")
+		},
+	}
+	apps := make([]workflow.App, 3*maxParallelLaunches)
+	for i := range apps {
+		apps[i] = workflow.App{Name: "a", Exec: "a"}
+	}
+
+	results := l.LaunchApps(apps)
+	require.Len(t, results, len(apps))
+	for _, r := range results {
+		assert.True(t, r.Launched)
+	}
+	assert.LessOrEqual(t, peak, maxParallelLaunches)
+}
+
+func TestLaunchApp_UnknownType(t *testing.T) {
+	l := &AppLauncher{
+		RunCommand: func(name string, arg ...string) *exec.Cmd {
+			t.Fatalf("unexpected launch of %q", name)
+			return nil
+		},
+	}
+	app := workflow.App{
+		Name: "odd",
+		Exec: "echo",
+		Type: "appimage",
+	}
+	ok, err := l.LaunchApp(app)
+	assert.False(t, ok)
+	assert.NoError(t, err)
+}
+
 func TestLaunchApp_EmptyExec(t *testing.T) {
 	l := New()
 	app := workflow.App{
@@ -139,6 +220,18 @@ func TestLaunchProcess_AbsolutePathNotFound(t *testing.T) {
 	assert.ErrorAs(t, err, &appLaunchErr)
 }
 
+func TestLookPath_Cached(t *testing.T) {
+	l := New()
+	want, err := exec.LookPath("echo")
+	require.NoError(t, err)
+
+	assert.Equal(t, want, l.lookPath("echo"))
+	assert.Equal(t, want, l.paths["echo"])
+	assert.Equal(t, "/bin/echo", l.lookPath("/bin/echo"))
+	assert.Equal(t, "no-such-cmd-99999", l.lookPath("no-such-cmd-99999"))
+	assert.NotContains(t, l.paths, "no-such-cmd-99999")
+}
+
 func TestExpandTilde(t *testing.T) {
 	home, err := os.UserHomeDir()
 	require.NoError(t, err)
@@ -161,6 +254,14 @@ func TestExpandTilde(t *testing.T) {
 	}
 }
 
+func TestExpandTilde_OtherUser(t *testing.T) {
+	usr, err := user.Current()
+	require.NoError(t, err)
+
+	assert.Equal(t, usr.HomeDir+"/notes", expandTilde("~"+usr.Username+"/notes"))
+	assert.Equal(t, "~no-such-user-99999/x", expandTilde("~no-such-user-99999/x"))
+}
+
 func TestExpandTilde_NoTilde(t *testing.T) {
 	result := expandTilde("/absolute/path")
 	assert.Equal(t, "/absolute/path", result)
@@ -168,6 +269,19 @@ func TestExpandTilde_NoTilde(t *testing.T) {
 	assert.Equal(t, "relative/path", result2)
 }
 
+func TestExpandArgs(t *testing.T) {
+	home, err := os.UserHomeDir()
+	require.NoError(t, err)
+
+	plain := []string{"app", "--flag", "a~b"}
+	assert.Same(t, &plain[0], &expandArgs(plain)[0])
+
+	in := []string{"app", "~/file"}
+	got := expandArgs(in)
+	assert.Equal(t, []string{"app", home + "/file"}, got)
+	assert.Equal(t, "~/file", in[1])
+}
+
 func TestLaunchProcess_StdoutDevNull(t *testing.T) {
 	l := New()
 	ok, err := l.LaunchProcess([]string{"echo", "should-not-appear"})
@@ -175,6 +289,22 @@ func TestLaunchProcess_StdoutDevNull(t *testing.T) {
 	assert.NoError(t, err)
 }
 
+func TestLaunchProcess_SharesDevNull(t *testing.T) {
+	l := New()
+	defer l.Close() //nolint:errcheck
+
+	ok, err := l.LaunchProcess([]string{"true"})
+	require.True(t, ok)
+	require.NoError(t, err)
+	first := l.devNull
+	require.NotNil(t, first)
+
+	ok, err = l.LaunchProcess([]string{"true"})
+	require.True(t, ok)
+	require.NoError(t, err)
+	assert.Same(t, first, l.devNull)
+}
+
 func TestRunCommandInjection(t *testing.T) {
 	var capturedName string
 	var capturedArgs []string
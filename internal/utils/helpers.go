@@ -1,16 +1,24 @@
 package utils
 
 import (
+	"bytes"
 	"errors"
 	"log/slog"
 	"os/exec"
+	"strings"
+	"sync"
 )
 
 // RunCommand executes a command synchronously and returns true on success.
 // On failure it logs the error and stderr (if available), then returns false.
+// Stdin and stdout go to the null device; only stderr is captured, since
+// nothing reads the output of a successful command.
 func RunCommand(name string, args ...string) bool {
-	cmd := exec.Command(name, args...) //nolint:gosec // Intentional run_command utility
-	out, err := cmd.CombinedOutput()
+	var stderr bytes.Buffer
+	cmd := exec.Command(commandPath(name), args...) //nolint:gosec // Intentional run_command utility
+	cmd.Args[0] = name
+	cmd.Stderr = &stderr
+	err := cmd.Run()
 	if err != nil {
 		var execErr *exec.Error
 		if errors.As(err, &execErr) {
@@ -18,7 +26,7 @@ func RunCommand(name string, args ...string) bool {
 		} else {
 			slog.Error("Error running command",
 				"cmd", name,
-				"stderr", string(out),
+				"stderr", stderr.String(),
 				"error", err,
 			)
 		}
@@ -28,17 +36,54 @@ func RunCommand(name string, args ...string) bool {
 	return true
 }
 
+// commandPaths caches the PATH lookup for bare command names passed to
+// RunCommand, which runs the same backend tool (wmctrl, hyprctl, niri) for
+// every workspace switch.
+var (
+	commandPathsMu sync.Mutex
+	commandPaths   = map[string]string{}
+)
+
+// commandPath returns the resolved path of a bare command name, looking it
+// up at most once while it is found.  Names containing a slash, and names
+// not found on PATH, are returned unchanged for exec to handle.
+func commandPath(name string) string {
+	if strings.Contains(name, "/") {
+		return name
+	}
+	commandPathsMu.Lock()
+	defer commandPathsMu.Unlock()
+	if path, ok := commandPaths[name]; ok {
+		return path
+	}
+	path, err := exec.LookPath(name)
+	if err != nil {
+		return name
+	}
+	commandPaths[name] = path
+	return path
+}
+
+// notifySendPath looks up notify-send once per process.
+var notifySendPath = sync.OnceValues(func() (string, error) {
+	return exec.LookPath("notify-send")
+})
+
 // Notify sends a desktop notification via notify-send.
 // If notify-send is not found on the system, it logs a warning and returns.
+// The notification is not waited on, so a slow notification daemon never
+// holds up the caller.
 func Notify(message string) {
-	_, err := exec.LookPath("notify-send")
+	path, err := notifySendPath()
 	if err != nil {
 		slog.Warn("notify-send not found, cannot notify user")
 		return
 	}
 	//nolint:gosec // user-provided message is intentional input
-	cmd := exec.Command("notify-send", "--app-name", "Floww", message)
-	if err := cmd.Run(); err != nil {
+	cmd := exec.Command(path, "--app-name", "Floww", message)
+	if err := cmd.Start(); err != nil {
 		slog.Error("Failed to send notification", "error", err)
+		return
 	}
+	go func() { _ = cmd.Wait() }()
 }
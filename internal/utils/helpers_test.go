@@ -1,6 +1,7 @@
 package utils
 
 import (
+	"path/filepath"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -35,3 +36,17 @@ func TestNotify_DoesNotPanic(t *testing.T) {
 func TestNotify_EmptyMessage(t *testing.T) {
 	Notify("")
 }
+
+func TestCommandPath_CachesLookup(t *testing.T) {
+	first := commandPath("echo")
+	assert.True(t, filepath.IsAbs(first))
+	commandPathsMu.Lock()
+	cached, ok := commandPaths["echo"]
+	commandPathsMu.Unlock()
+	assert.True(t, ok)
+	assert.Equal(t, first, cached)
+	assert.Equal(t, first, commandPath("echo"))
+
+	assert.Equal(t, "./relative/tool", commandPath("./relative/tool"))
+	assert.Equal(t, "this-command-does-not-exist-99999", commandPath("this-command-does-not-exist-99999"))
+}
@@ -2,6 +2,7 @@ package workflow
 
 import (
 	"fmt"
+	"strings"
 
 	"github.com/dagimg-dot/floww/internal/diagnostic"
 )
@@ -28,6 +29,38 @@ type Workflow struct {
 	FinalWorkspace *int        `yaml:"final_workspace" json:"final_workspace" toml:"final_workspace"`
 }
 
+// Clone returns a deep copy of w.
+func (w *Workflow) Clone() *Workflow {
+	c := *w
+	if w.FinalWorkspace != nil {
+		fw := *w.FinalWorkspace
+		c.FinalWorkspace = &fw
+	}
+	if w.Workspaces != nil {
+		c.Workspaces = make([]Workspace, len(w.Workspaces))
+		for i, ws := range w.Workspaces {
+			if ws.Apps != nil {
+				apps := make([]App, len(ws.Apps))
+				for j, app := range ws.Apps {
+					if app.Args != nil {
+						args := make([]string, len(app.Args))
+						copy(args, app.Args)
+						app.Args = args
+					}
+					if app.Wait != nil {
+						wait := *app.Wait
+						app.Wait = &wait
+					}
+					apps[j] = app
+				}
+				ws.Apps = apps
+			}
+			c.Workspaces[i] = ws
+		}
+	}
+	return &c
+}
+
 // WorkflowSchemaError represents a workflow schema validation error.
 type WorkflowSchemaError struct {
 	Message string
@@ -37,15 +70,6 @@ func (e *WorkflowSchemaError) Error() string {
 	return e.Message
 }
 
-// WorkflowNotFoundError represents a workflow not found error.
-type WorkflowNotFoundError struct {
-	Message string
-}
-
-func (e *WorkflowNotFoundError) Error() string {
-	return e.Message
-}
-
 // Locator resolves schema paths (e.g. "workspaces[0].apps[1].exec", built
 // with diagnostic.Path) to source positions. The path "" is the document
 // start. Implementations may return false for unknown paths.
@@ -55,13 +79,24 @@ type Locator interface {
 
 // ValidateWorkflow validates a workflow against the expected schema.
 // It returns nil if the workflow is valid, or a *WorkflowSchemaError
-// describing the first validation failure encountered.
+// listing every validation failure, one per line, so all of them can be
+// fixed in one go.
 func ValidateWorkflow(name string, data *Workflow) error {
 	diags := ValidateWorkflowDetailed(name, data, nil)
 	if len(diags) == 0 {
 		return nil
 	}
-	return &WorkflowSchemaError{Message: diags[0].Message}
+	if len(diags) == 1 {
+		return &WorkflowSchemaError{Message: diags[0].Message}
+	}
+	var b strings.Builder
+	for i, d := range diags {
+		if i > 0 {
+			b.WriteByte('\n')
+		}
+		b.WriteString(d.Message)
+	}
+	return &WorkflowSchemaError{Message: b.String()}
 }
 
 // ValidateWorkflowDetailed validates a workflow, accumulating every schema
@@ -115,55 +150,61 @@ func ValidateWorkflowDetailed(name string, data *Workflow, loc Locator) []diagno
 	for i := range data.Workspaces {
 		ws := &data.Workspaces[i]
 
+		// The workspace and app labels only appear in messages, so they are
+		// formatted on demand instead of once per entry of a valid workflow.
 		// ws_id: always use target format since Target is always present as int
-		wsID := fmt.Sprintf("workspace target '%d' (index %d)", ws.Target, i)
+		wsID := func() string {
+			return fmt.Sprintf("workspace target '%d' (index %d)", ws.Target, i)
+		}
 
 		if ws.Target < 0 {
 			add(diagnostic.Path("workspaces", i, "target"),
-				fmt.Sprintf("The 'target' key for %s must be an integer greater than or equal to 0.", wsID))
+				fmt.Sprintf("The 'target' key for %s must be an integer greater than or equal to 0.", wsID()))
 		}
 
 		if ws.Apps == nil {
 			add(diagnostic.Path("workspaces", i),
-				fmt.Sprintf("Workspace definition for %s is missing the required 'apps' key.", wsID))
+				fmt.Sprintf("Workspace definition for %s is missing the required 'apps' key.", wsID()))
 			continue
 		}
 
 		for j := range ws.Apps {
 			app := &ws.Apps[j]
 
-			appID := fmt.Sprintf("app index %d in %s", j, wsID)
-			if app.Name != "" {
-				appID = fmt.Sprintf("app '%s' (%s)", app.Name, appID)
+			appID := func() string {
+				id := fmt.Sprintf("app index %d in %s", j, wsID())
+				if app.Name != "" {
+					id = fmt.Sprintf("app '%s' (%s)", app.Name, id)
+				}
+				return id
 			}
 
-			namePath := diagnostic.Path("workspaces", i, "apps", j, "name")
 			if app.Name == "" {
 				diags = append(diags, diagnostic.Diagnostic{
-					Message:  fmt.Sprintf("App definition for %s is missing the required 'name' key.", appID),
-					Position: posOr(namePath, diagnostic.Path("workspaces", i, "apps", j)),
+					Message: fmt.Sprintf("App definition for %s is missing the required 'name' key.", appID()),
+					Position: posOr(diagnostic.Path("workspaces", i, "apps", j, "name"),
+						diagnostic.Path("workspaces", i, "apps", j)),
 				})
 			}
 
-			execPath := diagnostic.Path("workspaces", i, "apps", j, "exec")
 			if app.Exec == "" {
 				diags = append(diags, diagnostic.Diagnostic{
-					Message:  fmt.Sprintf("App definition for %s is missing the required 'exec' key.", appID),
-					Position: posOr(execPath, diagnostic.Path("workspaces", i, "apps", j)),
+					Message: fmt.Sprintf("App definition for %s is missing the required 'exec' key.", appID()),
+					Position: posOr(diagnostic.Path("workspaces", i, "apps", j, "exec"),
+						diagnostic.Path("workspaces", i, "apps", j)),
 				})
 			}
 
-			appType := app.Type
-			if appType == "" {
-				appType = "binary"
-			}
-			if appType != "binary" && appType != "flatpak" && appType != "snap" {
+			switch app.Type {
+			case "":
+				app.Type = "binary"
+			case "binary", "flatpak", "snap":
+			default:
 				diags = append(diags, diagnostic.Diagnostic{
-					Message:  fmt.Sprintf("The 'type' key for %s must be one of 'binary', 'flatpak', 'snap', but got '%s'.", appID, appType),
+					Message:  fmt.Sprintf("The 'type' key for %s must be one of 'binary', 'flatpak', 'snap', but got '%s'.", appID(), app.Type),
 					Position: pos(diagnostic.Path("workspaces", i, "apps", j, "type")),
 				})
 			}
-			app.Type = appType
 		}
 	}
 
@@ -195,10 +195,20 @@ func TestValidateWorkflow_ErrorOnFirstFailure(t *testing.T) {
 	assert.Contains(t, err.Error(), "name")
 }
 
-func TestValidateWorkflow_WorkflowNotFoundError(t *testing.T) {
-	err := &WorkflowNotFoundError{Message: "Workflow 'foo' not found"}
-	assert.Error(t, err)
-	assert.Equal(t, "Workflow 'foo' not found", err.Error())
+func TestValidateWorkflow_ReportsAllFailures(t *testing.T) {
+	wf := &Workflow{
+		Workspaces: []Workspace{
+			{Target: -1, Apps: []App{{Name: "term", Exec: "xterm"}}},
+			{Target: 1, Apps: []App{{Name: "term", Exec: ""}}},
+		},
+	}
+	err := ValidateWorkflow("test", wf)
+	require.Error(t, err)
+	assert.Equal(t,
+		"The 'target' key for workspace target '-1' (index 0) must be an integer greater than or equal to 0.\n"+
+			"App definition for app 'term' (app index 0 in workspace target '1' (index 1)) is missing the required 'exec' key.",
+		err.Error(),
+	)
 }
 
 func TestValidateWorkflow_WorkflowSchemaError(t *testing.T) {
@@ -303,3 +313,25 @@ func TestValidateWorkflowDetailed_AccumulatesTypeMutations(t *testing.T) {
 	assert.Empty(t, diags)
 	assert.Equal(t, "flatpak", wf.Workspaces[0].Apps[0].Type)
 }
+
+func TestWorkflowClone_Deep(t *testing.T) {
+	orig := &Workflow{
+		Description: "d",
+		Workspaces: []Workspace{
+			{Target: 1, Apps: []App{{Name: "a", Exec: "a", Args: []string{"x"}, Wait: ptr(1.5)}}},
+		},
+		FinalWorkspace: ptr(2),
+	}
+	c := orig.Clone()
+	require.Equal(t, orig, c)
+
+	c.Workspaces[0].Apps[0].Args[0] = "y"
+	*c.Workspaces[0].Apps[0].Wait = 3
+	*c.FinalWorkspace = 4
+	c.Workspaces[0].Apps[0].Type = "snap"
+
+	assert.Equal(t, "x", orig.Workspaces[0].Apps[0].Args[0])
+	assert.Equal(t, 1.5, *orig.Workspaces[0].Apps[0].Wait)
+	assert.Equal(t, 2, *orig.FinalWorkspace)
+	assert.Empty(t, orig.Workspaces[0].Apps[0].Type)
+}
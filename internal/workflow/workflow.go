@@ -3,6 +3,8 @@
 package workflow
 
 import (
+	"bufio"
+	"context"
 	"fmt"
 	"io"
 	"os"
@@ -19,11 +21,32 @@ const (
 	colorYellow = "\033[33m"
 )
 
+// Fixed status lines, coloured at compile time.
+const (
+	msgApplied   = colorGreen + "✓ Workflow applied successfully" + colorReset + "\n"
+	msgErrors    = colorYellow + "⚠ Workflow completed with errors" + colorReset + "\n"
+	msgCancelled = colorYellow + "⚠ Workflow cancelled" + colorReset + "\n"
+)
+
 // AppLauncher defines the interface for launching applications.
 type AppLauncher interface {
 	LaunchApp(app App) (bool, error)
 }
 
+// LaunchResult is the outcome of one launch in a batch, mirroring the return
+// values of AppLauncher.LaunchApp.
+type LaunchResult struct {
+	Launched bool
+	Err      error
+}
+
+// BatchLauncher is optionally implemented by an AppLauncher that can start
+// several apps at once. Apply uses it for runs of apps that have no wait
+// between them; results are returned in the order of apps.
+type BatchLauncher interface {
+	LaunchApps(apps []App) []LaunchResult
+}
+
 // WorkspaceManager defines the interface for workspace operations.
 type WorkspaceManager interface {
 	Switch(target int) bool
@@ -43,7 +66,10 @@ type WorkflowManager struct {
 	configMgr         ConfigManager
 	showNotifications bool
 	out               io.Writer
-	sleepFn           func(time.Duration)
+
+	// sleepFn, when set, is called by wait instead of starting a timer;
+	// tests set it to skip real waits.
+	sleepFn func(time.Duration)
 }
 
 // NewWorkflowManager creates a new WorkflowManager with the given dependencies.
@@ -54,7 +80,6 @@ func NewWorkflowManager(ws WorkspaceManager, al AppLauncher, cm ConfigManager) *
 		configMgr:         cm,
 		showNotifications: cm.GetGeneralConfig().ShowNotifications,
 		out:               os.Stdout,
-		sleepFn:           time.Sleep,
 	}
 }
 
@@ -63,13 +88,27 @@ func NewWorkflowManager(ws WorkspaceManager, al AppLauncher, cm ConfigManager) *
 // workflow to return false — only workspace switch failures contribute
 // to the final status.
 func (wm *WorkflowManager) Apply(data *Workflow, append bool) bool {
+	return wm.ApplyContext(context.Background(), data, append)
+}
+
+// ApplyContext is Apply with cancellation: the waits between launches and
+// workspaces end early when ctx is done, in which case no further apps are
+// launched or workspaces switched and the workflow reports failure.
+func (wm *WorkflowManager) ApplyContext(ctx context.Context, data *Workflow, append bool) bool {
+	// Progress lines are buffered and written out before each workspace
+	// switch, at each wait and on return rather than one write per line,
+	// so backend errors logged during a switch follow the line they
+	// belong to.
+	out := bufio.NewWriter(wm.out)
+	defer out.Flush() //nolint:errcheck
+
 	timing := wm.configMgr.GetTimingConfig()
 	workspaceSwitchWait := timing.WorkspaceSwitchWait
 	appLaunchWait := timing.AppLaunchWait
 	respectAppWait := timing.RespectAppWait
 
 	if data.Description != "" {
-		_, _ = fmt.Fprintf(wm.out, "Workflow: %s\n", data.Description)
+		_, _ = fmt.Fprintf(out, "Workflow: %s\n", data.Description)
 	}
 
 	success := true
@@ -79,6 +118,10 @@ func (wm *WorkflowManager) Apply(data *Workflow, append bool) bool {
 		appendBaseOffset = wm.workspaceMgr.GetAppendBaseOffset()
 	}
 
+	cancelled := false
+	var waits []float64
+
+workspaces:
 	for workspaceIdx := range data.Workspaces {
 		ws := &data.Workspaces[workspaceIdx]
 		target := ws.Target
@@ -87,70 +130,71 @@ func (wm *WorkflowManager) Apply(data *Workflow, append bool) bool {
 			target += appendBaseOffset
 		}
 
-		_, _ = fmt.Fprintf(wm.out, "--> Switching to workspace %d...\n", target)
+		_, _ = fmt.Fprintf(out, "--> Switching to workspace %d...\n", target)
+		_ = out.Flush()
 		if !wm.workspaceMgr.Switch(target) {
-			_, _ = fmt.Fprintf(wm.out, "%sError: Failed to switch workspace %d%s\n", colorRed, target, colorReset)
+			_, _ = fmt.Fprintf(out, "%sError: Failed to switch workspace %d%s\n", colorRed, target, colorReset)
 			success = false
 			continue
 		}
 
 		numApps := len(ws.Apps)
 		lastAppWaitToApply := 0.0
-
-		for appIdx := range ws.Apps {
-			app := &ws.Apps[appIdx]
-			appName := app.Name
-			if appName == "" {
-				appName = app.Exec
+		waits = planAppWaits(waits[:0], ws.Apps, appLaunchWait, respectAppWait)
+
+		for start := 0; start < numApps; {
+			// Apps with no wait after them are started together with the
+			// next one when the launcher supports batching.
+			end := start + 1
+			if _, ok := wm.appLauncher.(BatchLauncher); ok {
+				for end < numApps && waits[end-1] == 0 {
+					end++
+				}
 			}
-
-			_, _ = fmt.Fprintf(wm.out, "    -> Launching %s...\n", appName)
-			appLaunched := false
-
-			launched, err := wm.appLauncher.LaunchApp(*app)
-			switch {
-			case err != nil:
-				_, _ = fmt.Fprintf(wm.out, "    %s✗ Error launching %s: %s%s\n", colorRed, appName, err.Error(), colorReset)
-				success = false
-			case !launched:
-				_, _ = fmt.Fprintf(wm.out, "    %s✗ Failed to launch %s%s\n", colorRed, appName, colorReset)
-				success = false
-			default:
-				appLaunched = true
+			for appIdx := start; appIdx < end; appIdx++ {
+				_, _ = fmt.Fprintf(out, "    -> Launching %s...\n", displayName(&ws.Apps[appIdx]))
 			}
+			results := wm.launchApps(ws.Apps[start:end])
+
+			for appIdx := start; appIdx < end; appIdx++ {
+				appName := displayName(&ws.Apps[appIdx])
+				appLaunched := false
+
+				res := results[appIdx-start]
+				switch {
+				case res.Err != nil:
+					_, _ = fmt.Fprintf(out, "    %s✗ Error launching %s: %s%s\n", colorRed, appName, res.Err.Error(), colorReset)
+					success = false
+				case !res.Launched:
+					_, _ = fmt.Fprintf(out, "    %s✗ Failed to launch %s%s\n", colorRed, appName, colorReset)
+					success = false
+				default:
+					appLaunched = true
+				}
 
-			isLastAppInList := appIdx == numApps-1
+				isLastAppInList := appIdx == numApps-1
 
-			if appLaunched {
-				currentAppWait := 0.0
+				if appLaunched {
+					currentAppWait := waits[appIdx]
 
-				var appWaitConfig *float64
-				if respectAppWait {
-					appWaitConfig = app.Wait
-				}
+					shouldSkipWait := isLastAppInList &&
+						workspaceIdx == numWorkspaces-1 &&
+						data.FinalWorkspace == nil
 
-				if appWaitConfig != nil {
-					waitSeconds := *appWaitConfig
-					if waitSeconds >= 0 {
-						currentAppWait = waitSeconds
+					if currentAppWait > 0 && !shouldSkipWait {
+						_, _ = fmt.Fprintf(out, "    ... Waiting %.1fs before next action...\n", currentAppWait)
+						if !wm.wait(ctx, out, currentAppWait) {
+							cancelled = true
+							break workspaces
+						}
 					}
-				} else if !isLastAppInList {
-					currentAppWait = float64(appLaunchWait)
-				}
-
-				shouldSkipWait := isLastAppInList &&
-					workspaceIdx == numWorkspaces-1 &&
-					data.FinalWorkspace == nil
-
-				if currentAppWait > 0 && !shouldSkipWait {
-					_, _ = fmt.Fprintf(wm.out, "    ... Waiting %.1fs before next action...\n", currentAppWait)
-					wm.sleepFn(time.Duration(currentAppWait * float64(time.Second)))
-				}
 
-				if isLastAppInList {
-					lastAppWaitToApply = currentAppWait
+					if isLastAppInList {
+						lastAppWaitToApply = currentAppWait
+					}
 				}
 			}
+			start = end
 		}
 
 		if workspaceIdx < numWorkspaces-1 {
@@ -164,8 +208,11 @@ func (wm *WorkflowManager) Apply(data *Workflow, append bool) bool {
 				if lastAppWaitToApply <= 0 {
 					waitReason = "workspace switch"
 				}
-				_, _ = fmt.Fprintf(wm.out, "    ... Waiting %.1fs (due to %s) before next workspace...\n", finalWait, waitReason)
-				wm.sleepFn(time.Duration(finalWait * float64(time.Second)))
+				_, _ = fmt.Fprintf(out, "    ... Waiting %.1fs (due to %s) before next workspace...\n", finalWait, waitReason)
+				if !wm.wait(ctx, out, finalWait) {
+					cancelled = true
+					break workspaces
+				}
 			}
 		}
 	}
@@ -190,6 +237,11 @@ func (wm *WorkflowManager) Apply(data *Workflow, append bool) bool {
 		}
 	}
 
+	if cancelled {
+		_, _ = out.WriteString(msgCancelled)
+		return false
+	}
+
 	if success && data.FinalWorkspace != nil {
 		finalWait := lastWorkspaceAppWait
 		if lastWorkspaceAppWait <= 0 {
@@ -200,28 +252,32 @@ func (wm *WorkflowManager) Apply(data *Workflow, append bool) bool {
 		if lastWorkspaceAppWait <= 0 {
 			waitReason = "workspace switch"
 		}
-		_, _ = fmt.Fprintf(wm.out, "    ... Waiting %.1fs (due to %s) before final workspace...\n", finalWait, waitReason)
-		wm.sleepFn(time.Duration(finalWait * float64(time.Second)))
+		_, _ = fmt.Fprintf(out, "    ... Waiting %.1fs (due to %s) before final workspace...\n", finalWait, waitReason)
+		if !wm.wait(ctx, out, finalWait) {
+			_, _ = out.WriteString(msgCancelled)
+			return false
+		}
 
 		finalWorkspace := *data.FinalWorkspace
 		if append {
 			finalWorkspace += appendBaseOffset
 		}
 
-		_, _ = fmt.Fprintf(wm.out, "--> Switching to final workspace %d...\n", finalWorkspace)
+		_, _ = fmt.Fprintf(out, "--> Switching to final workspace %d...\n", finalWorkspace)
+		_ = out.Flush()
 		if !wm.workspaceMgr.Switch(finalWorkspace) {
-			_, _ = fmt.Fprintf(wm.out, "%sError: Failed to switch to final workspace %d%s\n", colorRed, finalWorkspace, colorReset)
+			_, _ = fmt.Fprintf(out, "%sError: Failed to switch to final workspace %d%s\n", colorRed, finalWorkspace, colorReset)
 			success = false
 		}
 	}
 
 	if success {
-		_, _ = fmt.Fprintf(wm.out, "%s✓ Workflow applied successfully%s\n", colorGreen, colorReset)
+		_, _ = out.WriteString(msgApplied)
 		if wm.showNotifications {
 			utils.Notify("Workflow applied successfully")
 		}
 	} else {
-		_, _ = fmt.Fprintf(wm.out, "%s⚠ Workflow completed with errors%s\n", colorYellow, colorReset)
+		_, _ = out.WriteString(msgErrors)
 		if wm.showNotifications {
 			utils.Notify("Workflow completed with errors")
 		}
@@ -229,3 +285,62 @@ func (wm *WorkflowManager) Apply(data *Workflow, append bool) bool {
 
 	return success
 }
+
+// planAppWaits appends to dst the wait after each app in apps, as applied
+// once that app has launched successfully: the app's own non-negative wait
+// when respected, otherwise appLaunchWait between apps and none after the
+// last one.
+func planAppWaits(dst []float64, apps []App, appLaunchWait float64, respectAppWait bool) []float64 {
+	for i := range apps {
+		w := 0.0
+		switch {
+		case respectAppWait && apps[i].Wait != nil:
+			w = max(*apps[i].Wait, 0)
+		case i != len(apps)-1:
+			w = appLaunchWait
+		}
+		dst = append(dst, w)
+	}
+	return dst
+}
+
+// wait flushes out, pauses for the given number of seconds and reports
+// whether ctx is still live afterwards; a cancelled ctx ends the wait
+// immediately.
+func (wm *WorkflowManager) wait(ctx context.Context, out *bufio.Writer, seconds float64) bool {
+	_ = out.Flush()
+	d := time.Duration(seconds * float64(time.Second))
+	if wm.sleepFn != nil {
+		wm.sleepFn(d)
+		return ctx.Err() == nil
+	}
+	t := time.NewTimer(d)
+	defer t.Stop()
+	select {
+	case <-t.C:
+		return true
+	case <-ctx.Done():
+		return false
+	}
+}
+
+// displayName is the name shown for app in progress output.
+func displayName(app *App) string {
+	if app.Name == "" {
+		return app.Exec
+	}
+	return app.Name
+}
+
+// launchApps starts apps, as one batch when the launcher supports it and
+// one at a time otherwise.
+func (wm *WorkflowManager) launchApps(apps []App) []LaunchResult {
+	if bl, ok := wm.appLauncher.(BatchLauncher); ok && len(apps) > 1 {
+		return bl.LaunchApps(apps)
+	}
+	results := make([]LaunchResult, len(apps))
+	for i := range apps {
+		results[i].Launched, results[i].Err = wm.appLauncher.LaunchApp(apps[i])
+	}
+	return results
+}
@@ -2,9 +2,11 @@ package workflow
 
 import (
 	"bytes"
+	"context"
 	"fmt"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/dagimg-dot/floww/internal/utils"
 	"github.com/stretchr/testify/assert"
@@ -41,6 +43,23 @@ func (m *mockAppLauncher) LaunchApp(app App) (bool, error) {
 	return true, nil
 }
 
+// mockBatchLauncher records how apps were grouped into batches.
+type mockBatchLauncher struct {
+	mockAppLauncher
+	batches [][]string
+}
+
+func (m *mockBatchLauncher) LaunchApps(apps []App) []LaunchResult {
+	names := make([]string, len(apps))
+	results := make([]LaunchResult, len(apps))
+	for i, app := range apps {
+		names[i] = app.Name
+		results[i].Launched, results[i].Err = m.LaunchApp(app)
+	}
+	m.batches = append(m.batches, names)
+	return results
+}
+
 type mockConfigManager struct {
 	timingConfig  *utils.TimingConfig
 	generalConfig *utils.GeneralConfig
@@ -582,3 +601,84 @@ func TestApply_NotificationOnPartialFailure(t *testing.T) {
 	assert.Contains(t, buf.String(), "\033[33m⚠ Workflow completed with errors\033[0m\n")
 	assert.True(t, wm.showNotifications)
 }
+
+// 17. Batch launching — apps with no wait between them start together.
+func TestApply_BatchesAppsWithoutWait(t *testing.T) {
+	ws := &mockWorkspaceManager{}
+	al := &mockBatchLauncher{
+		mockAppLauncher: mockAppLauncher{
+			launchFunc: func(app App) (bool, error) { return app.Name != "App2", nil },
+		},
+	}
+	cm := newMockCfg(&utils.TimingConfig{
+		WorkspaceSwitchWait: 0,
+		AppLaunchWait:       1,
+		RespectAppWait:      true,
+	})
+	wm, buf := newTestWM(ws, al, cm)
+	wm.sleepFn = func(time.Duration) {}
+
+	zero := 0.0
+	data := &Workflow{
+		Workspaces: []Workspace{
+			{
+				Target: 1,
+				Apps: []App{
+					{Name: "App1", Exec: "app1", Wait: &zero},
+					{Name: "App2", Exec: "app2", Wait: &zero},
+					{Name: "App3", Exec: "app3"},
+					{Name: "App4", Exec: "app4"},
+				},
+			},
+		},
+	}
+	success := wm.Apply(data, false)
+
+	assert.False(t, success)
+	assert.Equal(t, [][]string{{"App1", "App2", "App3"}}, al.batches)
+	assert.Len(t, al.launchCalls, 4)
+	output := buf.String()
+	assert.Contains(t, output, "\033[31m✗ Failed to launch App2\033[0m\n")
+	assert.Equal(t, 1, strings.Count(output, "... Waiting"))
+}
+
+// 18. Cancellation — a cancelled context ends the wait and stops the workflow.
+func TestApplyContext_CancelledStopsBeforeNextWorkspace(t *testing.T) {
+	ws := &mockWorkspaceManager{}
+	al := &mockAppLauncher{}
+	cm := newMockCfg(&utils.TimingConfig{
+		WorkspaceSwitchWait: 30,
+		AppLaunchWait:       0,
+		RespectAppWait:      true,
+	})
+	wm, buf := newTestWM(ws, al, cm)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	data := &Workflow{
+		Workspaces: []Workspace{
+			{Target: 1, Apps: []App{{Name: "App1", Exec: "app1"}}},
+			{Target: 2, Apps: []App{{Name: "App2", Exec: "app2"}}},
+		},
+	}
+	success := wm.ApplyContext(ctx, data, false)
+
+	assert.False(t, success)
+	assert.Equal(t, []int{1}, ws.switchCalls)
+	assert.Len(t, al.launchCalls, 1)
+	assert.Contains(t, buf.String(), "⚠ Workflow cancelled")
+	assert.NotContains(t, buf.String(), "Workflow applied successfully")
+}
+
+// 19. Wait plan — per-app waits are resolved once per workspace.
+func TestPlanAppWaits(t *testing.T) {
+	two, neg := 2.0, -1.0
+	apps := []App{{Name: "A", Wait: &two}, {Name: "B"}, {Name: "C", Wait: &neg}, {Name: "D"}}
+
+	assert.Equal(t, []float64{2, 0.5, 0, 0}, planAppWaits(nil, apps, 0.5, true))
+	assert.Equal(t, []float64{0.5, 0.5, 0.5, 0}, planAppWaits(nil, apps, 0.5, false))
+
+	buf := make([]float64, 0, 8)
+	assert.Equal(t, []float64{0}, planAppWaits(buf, apps[:1], 0.5, false))
+}
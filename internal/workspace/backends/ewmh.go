@@ -82,10 +82,11 @@ func internAtom(conn *xgb.Conn, name string) (xproto.Atom, error) {
 }
 
 // getCardinal reads a 32-bit cardinal (unsigned int) property from the root
-// window. It parses the first 4 bytes of the property value as little-endian.
+// window. It parses the first 4 bytes of the property value as little-endian;
+// only that one 32-bit unit is requested from the server.
 func getCardinal(conn *xgb.Conn, root xproto.Window, atom xproto.Atom) (uint32, error) {
 	reply, err := xproto.GetProperty(conn, false, root, atom,
-		xproto.GetPropertyTypeAny, 0, (1<<32)-1).Reply()
+		xproto.GetPropertyTypeAny, 0, 1).Reply()
 	if err != nil {
 		return 0, err
 	}